@@ -5,6 +5,8 @@ This library provides a pluggable architecture for parsing exports
 from various BI tools (Cognos, Tableau, Power BI, etc.).
 """
 
+from __future__ import annotations
+
 from .core import (
     BaseParser,
     BaseExtractor,
@@ -19,15 +21,19 @@ from .core import (
     ParseErrorLevel,
 )
 
-# Import and register parsers
-from .cognos import CognosParser
 
-# Register Cognos parser
-ParserRegistry.register("cognos", CognosParser)
+def __getattr__(name):
+    # PEP 562: keep `from bi_parsers import CognosParser` working without eager import
+    if name == "CognosParser":
+        from .cognos import CognosParser as parser_class
+        globals()[name] = parser_class
+        return parser_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "0.1.0"
 
-__all__ = [
+__all__ = (
     "BaseParser",
     "BaseExtractor",
     "ParserRegistry",
@@ -40,4 +46,4 @@ __all__ = [
     "RelationshipType",
     "ParseErrorLevel",
     "CognosParser",
-]
+)
@@ -1,9 +1,13 @@
 """Cognos 11.x parser module."""
 
+from __future__ import annotations
+
 from .parser import CognosParser
-from .config import CognosConfig
+from .config import CognosConfig, CognosFilters, get_cognos_config
 
-__all__ = [
+__all__ = (
     "CognosParser",
     "CognosConfig",
-]
+    "CognosFilters",
+    "get_cognos_config",
+)
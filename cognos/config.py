@@ -1,58 +1,209 @@
 """
 Configuration for Cognos parser.
 """
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
+from dataclasses import dataclass, field, fields
+from enum import IntFlag
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Tuple
 
-class CognosConfig(BaseModel):
-    """Configuration options for Cognos parser."""
+
+# String spellings accepted for bool options (config often comes from env/CLI/JSON text)
+_TRUE_STRINGS = frozenset({"1", "on", "t", "true", "y", "yes"})
+_FALSE_STRINGS = frozenset({"0", "off", "f", "false", "n", "no"})
+
+
+def _coerce_bool(name: str, value: Any) -> bool:
+    """
+    Return value as a bool for config option name.
+    
+    Accepts bools, 0/1 and the usual true/false strings ("yes", "off", ...).
+    
+    Raises:
+        TypeError: If value is not a bool, number or string
+        ValueError: If value does not spell a boolean
+    """
+    if type(value) is bool:
+        return value
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE_STRINGS:
+            return True
+        if text in _FALSE_STRINGS:
+            return False
+    elif isinstance(value, (int, float)):
+        if value == 1:
+            return True
+        if value == 0:
+            return False
+    else:
+        raise TypeError(f"{name} must be a bool, got {type(value).__name__} {value!r}")
+    raise ValueError(f"{name} must be a bool, got {value!r}")
+
+
+def _coerce_int(name: str, value: Any) -> int:
+    """
+    Return value as an int for config option name.
+    
+    Accepts ints, whole-number floats (10.0) and integer strings ("10").
+    
+    Raises:
+        TypeError: If value is not an int, float or string (bools included)
+        ValueError: If value is not a whole number
+    """
+    if type(value) is int:
+        return value
+    if isinstance(value, float):
+        if value.is_integer():
+            return int(value)
+    elif isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    else:
+        raise TypeError(f"{name} must be an int, got {type(value).__name__} {value!r}")
+    raise ValueError(f"{name} must be a whole number, got {value!r}")
+
+
+class CognosFilters(IntFlag):
+    """Boolean CognosConfig toggles packed into one int (see CognosConfig.flags)."""
+    FOLDERS = 1  # include_folders
+    HIDDEN = 2  # include_hidden
+    COL_LINEAGE = 4  # extract_column_lineage
+    CONTINUE_ON_ERROR = 8  # continue_on_error
+    STRICT = 16  # strict_validation
+
+
+# Bool options, normalized by CognosConfig.__post_init__
+_BOOL_FIELDS = (
+    "cleanup_temp",
+    "include_folders",
+    "include_hidden",
+    "extract_column_lineage",
+    "continue_on_error",
+    "strict_validation",
+)
+
+# Int options, normalized by CognosConfig.__post_init__ (before the size checks)
+_INT_FIELDS = ("max_file_size_mb", "streaming_threshold_mb", "max_relationship_depth")
+
+
+@dataclass(frozen=True, slots=True)
+class CognosConfig:
+    """Configuration options for Cognos parser (see describe() for option docs)."""
     
     # Cleanup options
-    cleanup_temp: bool = Field(
-        default=True,
-        description="Cleanup temporary extraction directory after parsing"
-    )
+    cleanup_temp: bool = True
     
     # Parsing options
-    max_file_size_mb: int = Field(
-        default=500,
-        description="Maximum file size in MB for parsing"
-    )
-    
-    streaming_threshold_mb: int = Field(
-        default=50,
-        description="Use streaming parser for files larger than this (MB)"
-    )
+    max_file_size_mb: int = 500
+    streaming_threshold_mb: int = 50
     
     # Object filtering
-    include_folders: bool = Field(
-        default=True,
-        description="Include folder objects in results"
-    )
-    
-    include_hidden: bool = Field(
-        default=False,
-        description="Include hidden objects in results"
-    )
+    include_folders: bool = True
+    include_hidden: bool = False
     
     # Relationship mapping
-    extract_column_lineage: bool = Field(
-        default=True,
-        description="Extract column-level lineage from queries"
-    )
-    
-    max_relationship_depth: int = Field(
-        default=10,
-        description="Maximum depth for relationship traversal"
-    )
+    extract_column_lineage: bool = True
+    max_relationship_depth: int = 10
     
     # Error handling
-    continue_on_error: bool = Field(
-        default=True,
-        description="Continue parsing even if individual objects fail"
-    )
-    
-    strict_validation: bool = Field(
-        default=False,
-        description="Enable strict validation of Cognos exports"
-    )
+    continue_on_error: bool = True
+    strict_validation: bool = False
+    
+    # Derived: boolean toggles as one bitmask, so per-object checks are a single AND
+    flags: CognosFilters = field(init=False, repr=False, compare=False)
+    # Derived: size thresholds in bytes, for comparing against file sizes directly
+    max_file_size_bytes: int = field(init=False, repr=False, compare=False)
+    streaming_threshold_bytes: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Config arrives as plain dicts (create_parser / CognosParser(config=...)), so
+        # normalize option types here; a string like "false" must not enable a filter
+        for name in _BOOL_FIELDS:
+            value = getattr(self, name)
+            if type(value) is not bool:
+                object.__setattr__(self, name, _coerce_bool(name, value))
+        for name in _INT_FIELDS:
+            value = getattr(self, name)
+            if type(value) is not int:
+                object.__setattr__(self, name, _coerce_int(name, value))
+        
+        if self.max_file_size_mb <= 0 or self.streaming_threshold_mb <= 0:
+            raise ValueError(
+                "max_file_size_mb and streaming_threshold_mb must be positive, "
+                f"got {self.max_file_size_mb} and {self.streaming_threshold_mb}"
+            )
+        object.__setattr__(self, "max_file_size_bytes", self.max_file_size_mb << 20)
+        object.__setattr__(self, "streaming_threshold_bytes", self.streaming_threshold_mb << 20)
+        
+        flags = CognosFilters(0)
+        if self.include_folders:
+            flags |= CognosFilters.FOLDERS
+        if self.include_hidden:
+            flags |= CognosFilters.HIDDEN
+        if self.extract_column_lineage:
+            flags |= CognosFilters.COL_LINEAGE
+        if self.continue_on_error:
+            flags |= CognosFilters.CONTINUE_ON_ERROR
+        if self.strict_validation:
+            flags |= CognosFilters.STRICT
+        object.__setattr__(self, "flags", flags)
+    
+    @classmethod
+    def default(cls) -> "CognosConfig":
+        """Return the shared default config (built once at import)."""
+        return _DEFAULT
+    
+    @classmethod
+    def describe(cls, field_name: str) -> str:
+        """
+        Return the description of a config option.
+        
+        Args:
+            field_name: Name of a CognosConfig field
+        
+        Returns:
+            Description text, or "" if the field is undocumented
+        """
+        from .config_docs import FIELD_DOCS
+        return FIELD_DOCS.get(field_name, "")
+    
+    @classmethod
+    def field_names(cls) -> FrozenSet[str]:
+        """Return the names of the settable (init) config fields."""
+        return _FIELD_NAMES
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CognosConfig":
+        """
+        Build a config from a dict, ignoring keys that are not config fields.
+        
+        Args:
+            data: Parser configuration dict
+        
+        Returns:
+            CognosConfig instance
+        """
+        return cls(**{key: data[key] for key in _FIELD_NAMES if key in data})
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(CognosConfig) if f.init)
+_DEFAULT = CognosConfig()
+
+
+@lru_cache(maxsize=32)
+def get_cognos_config(items: Tuple[Tuple[str, Any], ...] = ()) -> CognosConfig:
+    """
+    Return a shared CognosConfig for the given overrides.
+    
+    Args:
+        items: Config overrides as sorted (key, value) pairs,
+            e.g. tuple(sorted(overrides.items()))
+    
+    Returns:
+        Cached CognosConfig instance (frozen, safe to share)
+    """
+    return CognosConfig(**dict(items))
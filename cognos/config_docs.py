@@ -0,0 +1,18 @@
+"""
+Descriptions of CognosConfig options.
+
+Kept out of config.py so they are only loaded by help/documentation
+tooling (see CognosConfig.describe).
+"""
+
+FIELD_DOCS = {
+    "cleanup_temp": "Cleanup temporary extraction directory after parsing",
+    "max_file_size_mb": "Maximum file size in MB for parsing",
+    "streaming_threshold_mb": "Use streaming parser for files larger than this (MB)",
+    "include_folders": "Include folder objects in results",
+    "include_hidden": "Include hidden objects in results",
+    "extract_column_lineage": "Extract column-level lineage from queries",
+    "max_relationship_depth": "Maximum depth for relationship traversal",
+    "continue_on_error": "Continue parsing even if individual objects fail",
+    "strict_validation": "Enable strict validation of Cognos exports",
+}
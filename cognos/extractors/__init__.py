@@ -1,15 +1,87 @@
 """Extractors for Cognos objects."""
 
-from .folder_extractor import FolderExtractor
-from .report_extractor import ReportExtractor
-from .dashboard_extractor import DashboardExtractor
-from .data_module_extractor import DataModuleExtractor
-from .visualization_extractor import VisualizationExtractor
+from __future__ import annotations
 
-__all__ = [
+import importlib
+import sys
+from datetime import datetime
+from functools import partial
+from typing import Callable, Dict, FrozenSet
+
+# Extractor modules are imported on first attribute access (PEP 562), so a
+# parse only pays for the extractors it actually uses.
+_EXTRACTOR_MODULES = {
+    "FolderExtractor": "folder_extractor",
+    "ReportExtractor": "report_extractor",
+    "DashboardExtractor": "dashboard_extractor",
+    "DataModuleExtractor": "data_module_extractor",
+    "VisualizationExtractor": "visualization_extractor",
+}
+
+
+def intern_label(label):
+    """
+    Intern a short label that repeats across objects (query, table, column names).
+    
+    Repeated labels then share one string object, and equality checks on
+    them short-circuit on identity. Non-strings and long strings are returned as-is.
+    """
+    if type(label) is str and len(label) < 64:
+        return sys.intern(label)
+    return label
+
+
+try:
+    # Optional: ciso8601 parses ISO 8601 timestamps in C, "Z" suffix included
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = datetime.fromisoformat if sys.version_info >= (3, 11) else None
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp from a Cognos export (e.g. creationTime).
+    
+    Raises ValueError if the value is not a valid timestamp.
+    """
+    if _parse_iso_datetime is not None:
+        return _parse_iso_datetime(value)
+    # datetime.fromisoformat only accepts a "Z" suffix from Python 3.11
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _load_extractor(name: str) -> type:
+    """Return the extractor class called name, importing its module on first use."""
+    extractor_class = globals().get(name)
+    if extractor_class is None:
+        extractor_class = __getattr__(name)
+    return extractor_class
+
+
+def __getattr__(name):
+    module_name = _EXTRACTOR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    extractor_class = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = extractor_class
+    return extractor_class
+
+
+# Name membership and name -> loader dispatch for callers (e.g. CognosParser)
+EXTRACTOR_NAMES: FrozenSet[str] = frozenset(_EXTRACTOR_MODULES)
+EXTRACTOR_TABLE: Dict[str, Callable[[], type]] = {
+    name: partial(_load_extractor, name) for name in _EXTRACTOR_MODULES
+}
+
+
+__all__ = (
     "FolderExtractor",
     "ReportExtractor",
     "DashboardExtractor",
     "DataModuleExtractor",
     "VisualizationExtractor",
-]
+    "EXTRACTOR_NAMES",
+    "EXTRACTOR_TABLE",
+    "intern_label",
+    "parse_timestamp",
+)
@@ -3,41 +3,221 @@ Dashboard extractor for Cognos.
 
 Extracts dashboard (exploration) objects and their embedded visualizations
 from Cognos export files.
+
+Specification values come from a JSON decoder (json/orjson), which only
+produces plain dict/list/str, so the walk uses exact type checks
+(type(x) is dict) rather than isinstance.
 """
-from typing import List, Any, Dict, Optional, Tuple
-from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import List, Any, Dict, Iterator, Mapping, Optional, Set, Tuple, Union
+from functools import lru_cache
+from itertools import chain
 import json
 import logging
 import re
 
+try:
+    # Optional: orjson parses large specifications several times faster (accepts str directly)
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from ...core import BaseExtractor, ExtractedObject, Relationship, ParseError, ObjectType, RelationshipType
 from ...core.handlers import XmlHandler
 from ..visualization_types import map_dashboard_visid_to_type
+from . import intern_label, parse_timestamp
 
 
 logger = logging.getLogger(__name__)
 
-# Pattern: expression is only a single [connection].[table].[column] reference (no actual calculation)
-_SIMPLE_COLUMN_REF = re.compile(r"^\s*\[[^\]]+\]\.\[[^\]]+\]\.\[[^\]]+\]\s*$", re.IGNORECASE | re.DOTALL)
+# Enum members used per widget / calculation / sort / filter / tab, bound once
+# instead of looked up on the enum class each time
+_REL_USES = RelationshipType.USES
+_REL_CONTAINS = RelationshipType.CONTAINS
+_REL_PARENT_CHILD = RelationshipType.PARENT_CHILD
+_REL_FILTERS_BY = RelationshipType.FILTERS_BY
+_OBJ_CALCULATED_FIELD = ObjectType.CALCULATED_FIELD
+_OBJ_VISUALIZATION = ObjectType.VISUALIZATION
+_OBJ_SORT = ObjectType.SORT
+_OBJ_FILTER = ObjectType.FILTER
+_OBJ_TAB = ObjectType.TAB
+
+# Pattern: expression is only a single [connection].[table].[column] reference (no actual calculation).
+# \A/\Z anchors with surrounding \s* stand in for strip(); no letters or bare "." so no flags needed
+_SIMPLE_COLUMN_REF = re.compile(r"\A\s*\[[^\]]+\]\.\[[^\]]+\]\.\[[^\]]+\]\s*\Z")
+_SIMPLE_COLUMN_REF_MATCH = _SIMPLE_COLUMN_REF.match
+
+# Cognos classes CognosParser routes to this extractor
+_DASHBOARD_CLASSES = frozenset({"dashboard", "exploration", "story"})
+
+# Top-level child paths read by DashboardExtractor.extract (one find_many pass over the object)
+_SOURCE_PATHS = ("id", "name", "parentId", "storeID", "class", "props")
+
+# props paths read by DashboardExtractor.extract (resolved together via XmlHandler.find_many)
+_PROPS_PATHS = (
+    "creationTime/value",
+    "modificationTime/value",
+    "owner/value/item/searchPath/value",
+    "hidden/value",
+    "specification/value",
+)
+
+# moserJSON calculation usage (name or numeric code) -> data_usage
+EMBEDDED_CALC_USAGE_MAP = {
+    "fact": "measure",
+    "measure": "measure",
+    2: "measure",
+    "attribute": "attribute",
+    0: "attribute",
+    "dimension": "dimension",
+    1: "dimension",
+}
 
 
 def _expression_is_simple_column_reference(expression: Optional[str]) -> bool:
     """True if expression is only a single [M].[T].[C] reference (e.g. [bq-connection].[Orders].[Region])."""
     if not expression or not isinstance(expression, str):
         return False
-    return bool(_SIMPLE_COLUMN_REF.match(expression.strip()))
+    return _is_simple_column_reference_text(expression)
+
+
+@lru_cache(maxsize=4096)
+def _is_simple_column_reference_text(expression: str) -> bool:
+    # Calculation expressions repeat across dashboards and data sources
+    return _SIMPLE_COLUMN_REF_MATCH(expression) is not None
+
+
+# Shared read-only default for optional JSON objects (no fresh {} per lookup)
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Widget types that are always visualizations; other widgets need a visId
+_DATA_WIDGET_TYPES = frozenset({"live", "local", "datadriven"})
+
+# Keys holding sort configuration on a widget, its data and each of its dataViews
+_SORT_KEYS = ("sort", "sortBy", "defaultSort", "sortItems")
+
+# Constant leading entries of per-filter/per-tab property dicts, copied with
+# {**base, ...}; never mutated. Only leading keys live here so property order is unchanged
+_FILTER_PROPS_BASE: Dict[str, Any] = {"filter_scope": "dashboard_pageContext"}
+_TAB_PROPS_BASE: Dict[str, Any] = {"cognosClass": "tab"}
+_TAB_REL_PROPS_BASE: Dict[str, Any] = {"containment_type": "dashboard_tab"}
+_TAB_WIDGET_REL_PROPS_BASE: Dict[str, Any] = {"containment_type": "tab_visualization"}
+
+
+def _sort_direction(item: Dict[str, Any]) -> str:
+    """Normalize a sort item's direction/sortOrder/order to "ascending" or "descending"."""
+    d = item.get("direction") or item.get("sortOrder") or item.get("order") or ""
+    if type(d) is str:
+        d = d.strip().lower()
+        if d in ("desc", "descending"):
+            return "descending"
+    return "ascending"
+
+
+def _iter_repr_pieces(value: Any) -> Iterator[str]:
+    """Yield repr(value) in pieces, descending into decoded JSON lists and dicts lazily."""
+    value_type = type(value)
+    if value_type is list:
+        yield "["
+        separator = ""
+        for item in value:
+            yield separator
+            separator = ", "
+            yield from _iter_repr_pieces(item)
+        yield "]"
+    elif value_type is dict:
+        yield "{"
+        separator = ""
+        for key, item in value.items():
+            yield separator
+            separator = ", "
+            yield repr(key)
+            yield ": "
+            yield from _iter_repr_pieces(item)
+        yield "}"
+    else:
+        yield repr(value)
+
+
+def _str_prefix(value: Any, limit: int) -> str:
+    """
+    Return str(value), or a prefix of it longer than limit characters.
+    
+    Lists and dicts are rendered only until the text exceeds limit, so a
+    large value is not serialized in full just to be truncated.
+    """
+    if type(value) is not list and type(value) is not dict:
+        return str(value)
+    pieces: List[str] = []
+    size = 0
+    for piece in _iter_repr_pieces(value):
+        pieces.append(piece)
+        size += len(piece)
+        if size > limit:
+            break
+    return "".join(pieces)
+
+
+def _collect_widget_ids(items_data: Any) -> List[Any]:
+    """
+    Collect ids of type="widget" items from a nested layout items structure.
+    
+    Walks depth-first in document order with an explicit stack (no recursion),
+    descending into the "items" of each dict; non-dict list entries are skipped.
+    Nodes come from decoded JSON, so exact type checks stand in for isinstance.
+    """
+    widget_ids: List[Any] = []
+    stack = [items_data]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node = pop()
+        node_type = type(node)
+        if node_type is list:
+            # Reversed so the first item is popped (visited) first
+            stack.extend(item for item in reversed(node) if type(item) is dict)
+        elif node_type is dict:
+            if node.get("type") == "widget":
+                widget_id = node.get("id")
+                if widget_id:
+                    widget_ids.append(widget_id)
+            if "items" in node:
+                push(node["items"])
+    return widget_ids
 
 
 class DashboardExtractor(BaseExtractor):
     """Extractor for Cognos dashboard/exploration objects."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         super().__init__(bi_tool="cognos")
     
     @property
     def object_type(self) -> str:
         return ObjectType.DASHBOARD.value
     
+    def extract_stream(
+        self,
+        xml_path: Union[str, Path]
+    ) -> Iterator[tuple[List[ExtractedObject], List[Relationship], List[ParseError]]]:
+        """
+        Extract the dashboards of a package XML file while streaming it.
+        
+        Objects are read with iterparse and cleared once extracted, so only
+        the current object (and its specification text) is held in memory
+        rather than the whole package tree.
+        
+        Args:
+            xml_path: Path to a package XML file
+        
+        Yields:
+            (objects, relationships, errors) per dashboard object, in file order
+        """
+        for obj_elem in XmlHandler.iter_elements(xml_path, "object"):
+            if XmlHandler.get_text(obj_elem, "class") in _DASHBOARD_CLASSES:
+                yield self.extract(obj_elem)
+    
     def extract(
         self,
         source: Any
@@ -51,20 +231,21 @@ class DashboardExtractor(BaseExtractor):
         Returns:
             Tuple of (objects, relationships, errors)
         """
-        objects = []
-        relationships = []
-        errors = []
+        objects: List[ExtractedObject] = []
+        relationships: List[Relationship] = []
+        errors: List[ParseError] = []
         
         try:
-            # Get basic info
-            obj_id = XmlHandler.get_text(source, "id")
-            name = XmlHandler.get_text(source, "name", default="<unnamed>")
-            parent_id = XmlHandler.get_text(source, "parentId")
-            store_id = XmlHandler.get_text(source, "storeID")
-            obj_class = XmlHandler.get_text(source, "class")
+            # Get basic info (children indexed once instead of one scan per field)
+            top = XmlHandler.find_many(source, _SOURCE_PATHS)
+            obj_id = XmlHandler.get_text(top["id"])
+            name = XmlHandler.get_text(top["name"], default="<unnamed>")
+            parent_id = XmlHandler.get_text(top["parentId"])
+            store_id = XmlHandler.get_text(top["storeID"])
+            obj_class = XmlHandler.get_text(top["class"])
             
             # Get properties
-            props_elem = source.find("props")
+            props_elem = top["props"]
             properties = {
                 "storeID": store_id,
                 "cognosClass": obj_class
@@ -76,49 +257,39 @@ class DashboardExtractor(BaseExtractor):
             specification_json = None
             
             if props_elem is not None:
+                # Look up every props path we need in one pass over props_elem
+                found = XmlHandler.find_many(props_elem, _PROPS_PATHS)
+                
                 # Extract timestamps
-                creation_time_str = XmlHandler.get_text(
-                    props_elem,
-                    "creationTime/value"
-                )
-                mod_time_str = XmlHandler.get_text(
-                    props_elem,
-                    "modificationTime/value"
-                )
+                creation_time_str = XmlHandler.get_text(found["creationTime/value"])
+                mod_time_str = XmlHandler.get_text(found["modificationTime/value"])
                 
                 if creation_time_str:
                     try:
-                        created_at = datetime.fromisoformat(
-                            creation_time_str.replace('Z', '+00:00')
-                        )
+                        created_at = parse_timestamp(creation_time_str)
                         properties["creationTime"] = creation_time_str
                     except ValueError:
                         pass
                 
                 if mod_time_str:
                     try:
-                        modified_at = datetime.fromisoformat(
-                            mod_time_str.replace('Z', '+00:00')
-                        )
+                        modified_at = parse_timestamp(mod_time_str)
                         properties["modificationTime"] = mod_time_str
                     except ValueError:
                         pass
                 
                 # Extract owner
-                owner = XmlHandler.get_text(
-                    props_elem,
-                    "owner/value/item/searchPath/value"
-                )
+                owner = XmlHandler.get_text(found["owner/value/item/searchPath/value"])
                 if owner:
                     properties["owner"] = owner
                 
                 # Extract dashboard-specific properties
-                hidden = XmlHandler.get_text(props_elem, "hidden/value")
+                hidden = XmlHandler.get_text(found["hidden/value"])
                 if hidden:
                     properties["hidden"] = hidden.lower() == "true"
                 
                 # Extract specification JSON for visualization parsing (full content in case of split text nodes)
-                spec_elem = props_elem.find("specification/value")
+                spec_elem = found["specification/value"]
                 if spec_elem is not None:
                     specification_json = spec_elem.text or ""
                     if not specification_json and hasattr(spec_elem, "itertext"):
@@ -143,61 +314,64 @@ class DashboardExtractor(BaseExtractor):
                 rel = self._create_relationship(
                     source_id=parent_id,
                     target_id=obj_id,
-                    relationship_type=RelationshipType.PARENT_CHILD
+                    relationship_type=_REL_PARENT_CHILD
                 )
                 relationships.append(rel)
             
             # Extract visualizations, tabs, and dashboard filters from specification JSON
             if specification_json:
-                # Extract tabs first (they contain visualizations)
-                tab_objects, tab_rels, tab_errors = self._extract_tabs(
-                    specification_json,
-                    dashboard_id=obj_id,
-                    dashboard_name=name
-                )
-                objects.extend(tab_objects)
-                relationships.extend(tab_rels)
-                errors.extend(tab_errors)
-                
-                # Extract visualizations
-                viz_objects, viz_rels, viz_errors = self._extract_visualizations(
-                    specification_json,
-                    dashboard_id=obj_id,
-                    dashboard_name=name
-                )
-                objects.extend(viz_objects)
-                relationships.extend(viz_rels)
-                errors.extend(viz_errors)
-                
-                # Extract dashboard-level filters from pageContext (Dashboard L2 etc.)
-                filter_objects, filter_rels, filter_errors = self._extract_dashboard_filters(
-                    specification_json,
-                    dashboard_id=obj_id,
-                    dashboard_name=name
-                )
-                objects.extend(filter_objects)
-                relationships.extend(filter_rels)
-                errors.extend(filter_errors)
-                
-                # Store human names for data sources (assetId -> name) so report can show "Orders (BQ)..." instead of model id
+                # Parse once; every helper below works on the same dict
                 try:
-                    spec = json.loads(specification_json)
-                    sources = spec.get("dataSources", {}).get("sources", [])
-                    data_module_display_names = {}
-                    for ds in sources:
-                        if ds.get("type") != "module":
-                            continue
-                        key = ds.get("assetId") or ds.get("id")
-                        if key:
-                            data_module_display_names[str(key).strip()] = (ds.get("name") or ds.get("label") or "").strip()
-                    if data_module_display_names:
-                        for o in objects:
-                            if getattr(o, "object_id", None) == obj_id:
-                                o.properties = dict(o.properties) if o.properties else {}
-                                o.properties["data_module_display_names"] = data_module_display_names
-                                break
-                except (json.JSONDecodeError, TypeError, AttributeError):
-                    pass
+                    try:
+                        spec = _json_loads(specification_json)
+                    except ValueError:
+                        # orjson rejects some input json accepts (NaN, big ints); json also words the error
+                        spec = json.loads(specification_json)
+                except json.JSONDecodeError as e:
+                    errors.append(self._create_error(
+                        level="warning",
+                        message=f"Failed to parse dashboard JSON: {str(e)}"
+                    ))
+                else:
+                    # Only the parsed dict is needed from here on
+                    specification_json = None
+                    
+                    # Extract tabs and the visualizations they contain
+                    layout_objects, layout_rels, layout_errors = self._extract_tabs_and_widgets(
+                        spec,
+                        dashboard_id=obj_id,
+                        dashboard_name=name
+                    )
+                    objects.extend(layout_objects)
+                    relationships.extend(layout_rels)
+                    errors.extend(layout_errors)
+                    
+                    # Extract dashboard-level filters from pageContext (Dashboard L2 etc.)
+                    filter_objects, filter_rels, filter_errors = self._extract_dashboard_filters(
+                        spec,
+                        dashboard_id=obj_id,
+                        dashboard_name=name
+                    )
+                    objects.extend(filter_objects)
+                    relationships.extend(filter_rels)
+                    errors.extend(filter_errors)
+                    
+                    # Store human names for data sources (assetId -> name) so report can show "Orders (BQ)..." instead of model id
+                    try:
+                        sources = spec.get("dataSources", {}).get("sources", [])
+                        data_module_display_names: Dict[str, str] = {}
+                        for ds in sources:
+                            if ds.get("type") != "module":
+                                continue
+                            key = ds.get("assetId") or ds.get("id")
+                            if key:
+                                data_module_display_names[str(key).strip()] = (ds.get("name") or ds.get("label") or "").strip()
+                        if data_module_display_names:
+                            # The dashboard object is already in hand, and its properties dict is
+                            # owned by it alone, so it is updated in place rather than copied
+                            dashboard.properties["data_module_display_names"] = data_module_display_names
+                    except (TypeError, AttributeError):
+                        pass
             
         except Exception as e:
             error = self._create_error(
@@ -209,11 +383,108 @@ class DashboardExtractor(BaseExtractor):
         self._log_extraction(len(objects), len(errors))
         return objects, relationships, errors
     
+    def _find_tabs(self, spec: Dict[str, Any]) -> Any:
+        """
+        Find the tab entries of a dashboard layout.
+        
+        Tabs may be in layout.tabs, layout.tabPages/pages/sections, or be the
+        titled containers in layout.items.
+        
+        Args:
+            spec: The parsed dashboard specification JSON
+        
+        Returns:
+            List of tab entries (anything else means no tabs)
+        """
+        layout = spec.get("layout", {})
+        
+        # Check for tabs in layout (layout.get already rejected non-dict layouts
+        # with the error the caller reports, so layout is a dict from here on)
+        tabs_data = layout.get("tabs", [])
+        if not tabs_data:
+            # Sometimes tabs might be at root level or in a different structure
+            # Check for tab-like structures
+            for key in ("tabPages", "pages", "sections"):
+                if key in layout:
+                    tabs_data = layout[key]
+                    break
+            
+            # Check for tabs in layout.items where items have type="container" and title
+            # This is a common structure where tabs are containers within the layout
+            if not tabs_data and "items" in layout:
+                items = layout.get("items", [])
+                if type(items) is list:
+                    # Items that are containers with titles are the tabs (if there are any)
+                    tabs_data = [
+                        item for item in items
+                        if type(item) is dict and
+                        item.get("type") == "container" and
+                        ("title" in item or item.get("name"))
+                    ] or tabs_data
+        
+        # If tabs_data is a dict, convert to list
+        if type(tabs_data) is dict:
+            tabs_data = [tabs_data]
+        
+        return tabs_data
+    
+    def _map_tab_widgets(
+        self,
+        tab_data: Dict[str, Any],
+        dashboard_id: str,
+        widget_to_tab: Dict[str, str]
+    ) -> List[Any]:
+        """
+        Map the widgets of one tab to its tab object ID.
+        
+        Widgets come from the tab's widgets list/dict, its layout.widgets and
+        its nested items; only tabs with an explicit id/identifier parent them.
+        
+        Args:
+            tab_data: Tab entry from the layout
+            dashboard_id: Parent dashboard ID
+            widget_to_tab: Widget ID -> tab object ID, updated in place
+        
+        Returns:
+            Widget IDs found in the tab's nested items
+        """
+        tab_items = tab_data.get("items", [])
+        item_widget_ids = _collect_widget_ids(tab_items) if tab_items else []
+        
+        # Only tabs with an explicit id parent their widgets
+        tab_id_raw = tab_data.get("id") or tab_data.get("identifier", "")
+        if not tab_id_raw:
+            return item_widget_ids
+        tab_id = f"{dashboard_id}:tab:{tab_id_raw}"
+        tab_widgets = tab_data.get("widgets", [])
+        # Each source is mapped with one C-level update; str() on an id that is
+        # already a str returns it as-is, other scalars (numeric ids) are converted
+        map_widgets = widget_to_tab.update
+        if type(tab_widgets) is list:
+            map_widgets(dict.fromkeys(map(str, tab_widgets), tab_id))
+        elif type(tab_widgets) is dict:
+            # JSON object keys are always strings
+            map_widgets(dict.fromkeys(tab_widgets, tab_id))
+        
+        # Also check layout within tab
+        tab_layout = tab_data.get("layout", {})
+        if type(tab_layout) is dict:
+            layout_widgets = tab_layout.get("widgets", [])
+            if layout_widgets:
+                map_widgets(dict.fromkeys(map(str, layout_widgets), tab_id))
+        
+        if item_widget_ids:
+            map_widgets(dict.fromkeys(map(str, item_widget_ids), tab_id))
+        
+        return item_widget_ids
+    
     def _extract_visualizations(
         self,
-        json_content: str,
+        spec: Dict[str, Any],
+        widget_to_tab: Dict[str, str],
         dashboard_id: str,
-        dashboard_name: str
+        dashboard_name: str,
+        widget_obj_ids: Optional[Dict[str, str]] = None
     ) -> tuple[List[ExtractedObject], List[Relationship], List[ParseError]]:
         """
         Extract visualization widgets from dashboard JSON specification.
@@ -224,31 +495,29 @@ class DashboardExtractor(BaseExtractor):
         - dataSources: Data source references for each visualization
         
         Args:
-            json_content: The dashboard specification JSON string
+            spec: The parsed dashboard specification JSON
+            widget_to_tab: Widget ID -> tab object ID (from _map_tab_widgets)
             dashboard_id: Parent dashboard ID
             dashboard_name: Parent dashboard name for context
+            widget_obj_ids: Widget ID -> visualization object ID already built by the tab pass
             
         Returns:
             Tuple of (objects, relationships, errors)
         """
-        objects = []
-        relationships = []
-        errors = []
-        
-        try:
-            spec = json.loads(json_content)
-        except json.JSONDecodeError as e:
-            errors.append(self._create_error(
-                level="warning",
-                message=f"Failed to parse dashboard JSON: {str(e)}"
-            ))
-            return objects, relationships, errors
+        objects: List[ExtractedObject] = []
+        relationships: List[Relationship] = []
+        errors: List[ParseError] = []
         
         # Extract widgets dictionary
         widgets = spec.get("widgets", {})
         
         # Extract data sources for linking and embedded calculations
-        data_sources = {}
+        data_sources: Dict[str, Dict[str, Any]] = {}
+        # Bound once for the per-source / per-calculation loops below
+        usage_to_data_usage = EMBEDDED_CALC_USAGE_MAP.get
+        add_object = objects.append
+        add_relationship = relationships.append
+        bi_tool = self.bi_tool
         for ds in spec.get("dataSources", {}).get("sources", []):
             ds_id = ds.get("id")
             if ds_id:
@@ -273,14 +542,14 @@ class DashboardExtractor(BaseExtractor):
                             rel = Relationship(
                                 source_id=dashboard_id,
                                 target_id=ref_store_id,
-                                relationship_type=RelationshipType.USES,
+                                relationship_type=_REL_USES,
                                 properties={
                                     "dependency_type": "data_source",
                                     "ref_type": use_spec.get("type", "module"),
                                     "identifier": use_spec.get("identifier", "")
                                 }
                             )
-                            relationships.append(rel)
+                            add_relationship(rel)
                             break
                 # Fallback: link dashboard to module by assetId when type is "module" (covers missing/empty useSpec)
                 if ref_store_id is None and ds.get("type") == "module":
@@ -289,14 +558,14 @@ class DashboardExtractor(BaseExtractor):
                         rel = Relationship(
                             source_id=dashboard_id,
                             target_id=asset_id,
-                            relationship_type=RelationshipType.USES,
+                            relationship_type=_REL_USES,
                             properties={
                                 "dependency_type": "data_source",
                                 "ref_type": "module",
                                 "identifier": "",
                             }
                         )
-                        relationships.append(rel)
+                        add_relationship(rel)
                 if moser_json:
                     
                     # Extract embedded calculations (keep as CALCULATED_FIELD; data_usage in properties).
@@ -311,15 +580,15 @@ class DashboardExtractor(BaseExtractor):
                             continue
                         usage = calc.get("usage", "")
                         # Map usage to data_usage for downstream (measure/dimension/attribute)
-                        data_usage = "unknown"
-                        if usage in ("fact", "measure") or usage == 2:
-                            data_usage = "measure"
-                        elif usage in ("attribute", "dimension") or usage in (0, 1):
-                            data_usage = "dimension" if usage in (1, "dimension") else "attribute"
+                        try:
+                            data_usage = usage_to_data_usage(usage, "unknown")
+                        except TypeError:
+                            # Unhashable usage (list/dict) in malformed JSON
+                            data_usage = "unknown"
                         
                         calc_obj = ExtractedObject(
                             object_id=calc_id,
-                            object_type=ObjectType.CALCULATED_FIELD,
+                            object_type=_OBJ_CALCULATED_FIELD,
                             name=calc_name,
                             parent_id=dashboard_id,
                             properties={
@@ -331,115 +600,46 @@ class DashboardExtractor(BaseExtractor):
                                 "cognosClass": "embeddedCalculation",
                                 "source": "moserJSON"
                             },
-                            bi_tool=self.bi_tool
+                            bi_tool=bi_tool
                         )
-                        objects.append(calc_obj)
+                        add_object(calc_obj)
                         
                         # Create CONTAINS relationship
                         rel = Relationship(
                             source_id=dashboard_id,
                             target_id=calc_id,
-                            relationship_type=RelationshipType.CONTAINS
+                            relationship_type=_REL_CONTAINS
                         )
-                        relationships.append(rel)
-        
-        # Build widget-to-tab mapping from layout
-        widget_to_tab = {}
-        layout = spec.get("layout", {})
-        tabs_data = layout.get("tabs", [])
-        if not tabs_data and isinstance(layout, dict):
-            for key in ["tabPages", "pages", "sections"]:
-                if key in layout:
-                    tabs_data = layout[key]
-                    break
-            
-            # Check for tabs in layout.items where items have type="container" and title
-            if not tabs_data and "items" in layout:
-                items = layout.get("items", [])
-                if isinstance(items, list):
-                    # Filter for items that are containers with titles (these are tabs)
-                    container_items = [
-                        item for item in items
-                        if isinstance(item, dict) and 
-                        item.get("type") == "container" and 
-                        ("title" in item or item.get("name"))
-                    ]
-                    if container_items:
-                        tabs_data = container_items
-        
-        if isinstance(tabs_data, dict):
-            tabs_data = [tabs_data]
+                        add_relationship(rel)
         
-        def extract_widget_ids_from_items(items_data, tab_id):
-            """Recursively extract widget IDs from nested items structure and map to tab."""
-            if isinstance(items_data, list):
-                for item in items_data:
-                    if isinstance(item, dict):
-                        # If item is a widget, map its ID to the tab
-                        if item.get("type") == "widget":
-                            widget_id = item.get("id")
-                            if widget_id:
-                                widget_to_tab[str(widget_id)] = tab_id
-                        # Recursively check nested items
-                        if "items" in item:
-                            extract_widget_ids_from_items(item["items"], tab_id)
-            elif isinstance(items_data, dict):
-                if items_data.get("type") == "widget":
-                    widget_id = items_data.get("id")
-                    if widget_id:
-                        widget_to_tab[str(widget_id)] = tab_id
-                if "items" in items_data:
-                    extract_widget_ids_from_items(items_data["items"], tab_id)
-        
-        if isinstance(tabs_data, list):
-            for tab_data in tabs_data:
-                tab_id_raw = tab_data.get("id") or tab_data.get("identifier", "")
-                if tab_id_raw:
-                    tab_id = f"{dashboard_id}:tab:{tab_id_raw}"
-                    tab_widgets = tab_data.get("widgets", [])
-                    if isinstance(tab_widgets, list):
-                        for widget_ref in tab_widgets:
-                            widget_to_tab[str(widget_ref)] = tab_id
-                    elif isinstance(tab_widgets, dict):
-                        for widget_ref in tab_widgets.keys():
-                            widget_to_tab[str(widget_ref)] = tab_id
-                    
-                    # Also check layout within tab
-                    tab_layout = tab_data.get("layout", {})
-                    if isinstance(tab_layout, dict):
-                        layout_widgets = tab_layout.get("widgets", [])
-                        if layout_widgets:
-                            for widget_ref in layout_widgets:
-                                widget_to_tab[str(widget_ref)] = tab_id
-                    
-                    # Extract widgets from nested items structure
-                    tab_items = tab_data.get("items", [])
-                    if tab_items:
-                        extract_widget_ids_from_items(tab_items, tab_id)
-        
-        # Process each widget
+        # Process each widget (methods bound once; this loop runs per widget)
+        process_widget = self._process_widget
+        extract_widget_sorts = self._extract_widget_sorts
+        add_objects = objects.extend
+        add_relationships = relationships.extend
         for widget_id, widget_data in widgets.items():
             try:
-                viz_obj, viz_rels = self._process_widget(
+                viz_obj, viz_rels = process_widget(
                     widget_id=widget_id,
                     widget_data=widget_data,
                     dashboard_id=dashboard_id,
                     data_sources=data_sources,
-                    widget_to_tab=widget_to_tab
+                    widget_to_tab=widget_to_tab,
+                    widget_obj_ids=widget_obj_ids
                 )
                 
                 if viz_obj:
-                    objects.append(viz_obj)
-                    relationships.extend(viz_rels)
+                    add_object(viz_obj)
+                    add_relationships(viz_rels)
                     # Extract sort configuration from widget JSON (sortBy, defaultSort, sort, dataViews[].sort, etc.)
-                    sort_objs, sort_rels = self._extract_widget_sorts(
+                    sort_objs, sort_rels = extract_widget_sorts(
                         widget_id=widget_id,
                         widget_data=widget_data,
                         dashboard_id=dashboard_id,
                         viz_obj_id=viz_obj.object_id,
                     )
-                    objects.extend(sort_objs)
-                    relationships.extend(sort_rels)
+                    add_objects(sort_objs)
+                    add_relationships(sort_rels)
                     
             except Exception as e:
                 logger.debug(f"Error processing widget {widget_id}: {e}")
@@ -453,7 +653,8 @@ class DashboardExtractor(BaseExtractor):
         widget_data: Dict[str, Any],
         dashboard_id: str,
         data_sources: Dict[str, Any],
-        widget_to_tab: Optional[Dict[str, str]] = None
+        widget_to_tab: Optional[Dict[str, str]] = None,
+        widget_obj_ids: Optional[Dict[str, str]] = None
     ) -> tuple[Optional[ExtractedObject], List[Relationship]]:
         """
         Process a single widget and create visualization object with relationships.
@@ -463,72 +664,70 @@ class DashboardExtractor(BaseExtractor):
             widget_data: Widget data dictionary
             dashboard_id: Parent dashboard ID
             data_sources: Data sources available in dashboard
+            widget_to_tab: Widget ID -> tab object ID
+            widget_obj_ids: Widget ID -> visualization object ID already built by the tab pass
             
         Returns:
             Tuple of (visualization object, relationships)
         """
-        relationships = []
+        relationships: List[Relationship] = []
         
         # Get visId to determine chart type
-        vis_id = widget_data.get("visId", "")
-        widget_type = widget_data.get("type", "")
+        # visId / type / slot / modelRef values repeat across widgets; intern them
+        # so every widget's properties share one copy of each
+        vis_id = intern_label(widget_data.get("visId", ""))
+        widget_type = intern_label(widget_data.get("type", ""))
         
-        # Skip non-visualization widgets (e.g., text, images)
-        if widget_type not in ("live", "local", "datadriven"):
+        # Skip non-visualization widgets (e.g., text, images) before doing any other work
+        if not vis_id and widget_type not in _DATA_WIDGET_TYPES:
             # Could be a text widget or other non-data widget
-            if not vis_id:
-                return None, []
+            return None, []
         
         # Map visId to human-readable type
         viz_type = map_dashboard_visid_to_type(vis_id)
         
-        # Get widget name
-        name_data = widget_data.get("name", {})
-        if isinstance(name_data, dict):
+        # Get widget name (missing, empty and "{}" names all fall back to "<type> Widget")
+        name_data = widget_data.get("name")
+        if type(name_data) is dict:
             # translationTable format
-            trans_table = name_data.get("translationTable", {})
-            widget_name = trans_table.get("Default", trans_table.get("en-us", f"{viz_type} Widget"))
-        elif isinstance(name_data, str):
+            trans_table = name_data.get("translationTable", _EMPTY_MAPPING)
+            widget_name = trans_table.get("Default", trans_table.get("en-us"))
+        elif type(name_data) is str:
             widget_name = name_data
         else:
-            widget_name = f"{viz_type} Widget"
+            widget_name = None
         
         if not widget_name or widget_name == "{}":
             widget_name = f"{viz_type} Widget"
         
-        # Create unique object ID
-        viz_obj_id = f"{dashboard_id}:widget:{widget_id}"
+        # Create unique object ID (reuse the one the tab pass built, if any)
+        viz_obj_id = widget_obj_ids.get(widget_id) if widget_obj_ids else None
+        if viz_obj_id is None:
+            viz_obj_id = f"{dashboard_id}:widget:{widget_id}"
         
-        # Extract data items (columns/measures used)
-        data_items = []
+        # Extract data items (columns/measures used): slot items, then data view items.
+        # Items stay dicts: data_items is part of the visualization's output
+        # properties, and consumers read these keys
         slot_mapping = widget_data.get("slotmapping", {})
-        
-        for slot in slot_mapping.get("slots", []):
-            slot_name = slot.get("name", "")
-            for data_item_id in slot.get("dataItems", []):
-                data_items.append({
-                    "slot": slot_name,
-                    "dataItemId": data_item_id
-                })
+        data_items: List[Dict[str, Any]] = [
+            {"slot": slot_name, "dataItemId": data_item_id}
+            for slot in slot_mapping.get("slots", [])
+            for slot_name in (intern_label(slot.get("name", "")),)
+            for data_item_id in slot.get("dataItems", [])
+        ]
         
         # Extract data view references
-        data_view_refs = []
         data_views = widget_data.get("data", {}).get("dataViews", [])
-        for dv in data_views:
-            model_ref = dv.get("modelRef")
-            if model_ref:
-                data_view_refs.append(model_ref)
-            
-            # Also capture individual data items with their full paths
-            for item in dv.get("dataItems", []):
-                item_id = item.get("itemId", "")
-                item_label = item.get("itemLabel", "")
-                if item_id:
-                    data_items.append({
-                        "itemId": item_id,
-                        "itemLabel": item_label,
-                        "modelRef": model_ref
-                    })
+        model_refs = [intern_label(dv.get("modelRef")) for dv in data_views]
+        data_view_refs: List[Any] = [model_ref for model_ref in model_refs if model_ref]
+        
+        # Also capture individual data items with their full paths
+        data_items.extend(
+            {"itemId": item_id, "itemLabel": item.get("itemLabel", ""), "modelRef": model_ref}
+            for dv, model_ref in zip(data_views, model_refs)
+            for item in dv.get("dataItems", [])
+            if (item_id := item.get("itemId", ""))
+        )
         
         # Build properties
         properties = {
@@ -542,7 +741,7 @@ class DashboardExtractor(BaseExtractor):
         # Create visualization object
         viz_obj = ExtractedObject(
             object_id=viz_obj_id,
-            object_type=ObjectType.VISUALIZATION,
+            object_type=_OBJ_VISUALIZATION,
             name=widget_name,
             parent_id=dashboard_id,
             properties=properties,
@@ -560,7 +759,7 @@ class DashboardExtractor(BaseExtractor):
         rel_contains = Relationship(
             source_id=parent_id,
             target_id=viz_obj_id,
-            relationship_type=RelationshipType.CONTAINS,
+            relationship_type=_REL_CONTAINS,
             properties={
                 "containment_type": "tab_visualization" if parent_id != dashboard_id else "dashboard_visualization"
             }
@@ -572,7 +771,7 @@ class DashboardExtractor(BaseExtractor):
             rel_dashboard = Relationship(
                 source_id=dashboard_id,
                 target_id=viz_obj_id,
-                relationship_type=RelationshipType.CONTAINS,
+                relationship_type=_REL_CONTAINS,
                 properties={
                     "containment_type": "dashboard_visualization",
                     "via_tab": True
@@ -581,22 +780,23 @@ class DashboardExtractor(BaseExtractor):
             relationships.append(rel_dashboard)
         
         # Create USES relationships for data sources
+        add_relationship = relationships.append
         for model_ref in data_view_refs:
-            if model_ref in data_sources:
-                ds_info = data_sources[model_ref]
+            ds_info = data_sources.get(model_ref)
+            if ds_info is not None:
                 asset_id = ds_info.get("assetId")
                 if asset_id:
                     rel_uses = Relationship(
                         source_id=viz_obj_id,
                         target_id=asset_id,
-                        relationship_type=RelationshipType.USES,
+                        relationship_type=_REL_USES,
                         properties={
                             "dependency_type": "data_source",
                             "data_source_name": ds_info.get("name"),
                             "data_source_type": ds_info.get("type")
                         }
                     )
-                    relationships.append(rel_uses)
+                    add_relationship(rel_uses)
         
         return viz_obj, relationships
 
@@ -621,80 +821,61 @@ class DashboardExtractor(BaseExtractor):
         """
         sort_objects: List[ExtractedObject] = []
         sort_relationships: List[Relationship] = []
-        raw_items: List[Dict[str, Any]] = []
-
-        def _column_ref(item: Any) -> Optional[str]:
-            if isinstance(item, str) and item.strip():
-                return item.strip()
-            if isinstance(item, dict):
-                return (
-                    item.get("dataItemId") or item.get("itemId") or item.get("refDataItem")
-                    or item.get("dataItem") or item.get("column")
-                )
-            return None
 
-        def _direction(item: Any) -> str:
-            if isinstance(item, dict):
-                d = (
-                    item.get("direction") or item.get("sortOrder") or item.get("order")
-                    or ""
-                )
-                if isinstance(d, str):
-                    d = d.strip().lower()
-                    if d in ("asc", "ascending"):
-                        return "ascending"
-                    if d in ("desc", "descending"):
-                        return "descending"
-            return "ascending"
-
-        def _collect(value: Any) -> None:
-            if value is None:
-                return
-            if isinstance(value, list):
-                for v in value:
-                    _collect(v)
-                return
-            if isinstance(value, dict):
-                col = _column_ref(value)
-                if col:
-                    raw_items.append({"column": col, "direction": _direction(value)})
-                return
-            if isinstance(value, str) and value.strip():
-                raw_items.append({"column": value.strip(), "direction": "ascending"})
-
-        # Widget-level sort keys
-        for key in ("sort", "sortBy", "defaultSort", "sortItems"):
-            _collect(widget_data.get(key))
-
-        # data.sort, data.sortBy, data.defaultSort, data.sortItems
+        # Sort values in lookup order: widget keys, then data keys, then each dataView's keys
+        values: List[Any] = [widget_data.get(key) for key in _SORT_KEYS]
         data = widget_data.get("data") or {}
-        if isinstance(data, dict):
-            for key in ("sort", "sortBy", "defaultSort", "sortItems"):
-                _collect(data.get(key))
-
-        # Per dataView: sort, sortBy, defaultSort, sortItems
-        data_views = data.get("dataViews", []) if isinstance(data, dict) else []
-        for dv in data_views if isinstance(data_views, list) else []:
-            if not isinstance(dv, dict):
+        if type(data) is dict:
+            values.extend(data.get(key) for key in _SORT_KEYS)
+        data_views = data.get("dataViews", []) if type(data) is dict else []
+        for dv in data_views if type(data_views) is list else []:
+            if type(dv) is not dict:
+                continue
+            values.extend(dv.get(key) for key in _SORT_KEYS)
+
+        # Walk the values depth-first with an explicit stack (lists are flattened,
+        # dicts and strings are sort items) and deduplicate as items are found
+        sort_items: List[Tuple[str, str]] = []
+        seen_directions: Dict[str, Set[str]] = {}  # lowercased column -> directions already added
+        add_item = sort_items.append
+        stack = values[::-1]
+        pop = stack.pop
+        while stack:
+            value = pop()
+            if type(value) is list:
+                # Reversed so the first entry is popped (visited) first
+                stack.extend(reversed(value))
+                continue
+            if type(value) is dict:
+                col = (
+                    value.get("dataItemId") or value.get("itemId") or value.get("refDataItem")
+                    or value.get("dataItem") or value.get("column")
+                )
+                if not col:
+                    continue
+                direction = _sort_direction(value)
+            elif type(value) is str:
+                col = value.strip()
+                if not col:
+                    continue
+                direction = "ascending"
+            else:
                 continue
-            for key in ("sort", "sortBy", "defaultSort", "sortItems"):
-                _collect(dv.get(key))
-
-        seen_keys: set = set()
-        sort_idx = 0
-        for item in raw_items:
-            col = item.get("column") or ""
-            direction = item.get("direction") or "ascending"
-            key = (col.lower(), direction)
-            if key in seen_keys:
+            col_key = col.lower()
+            directions = seen_directions.get(col_key)
+            if directions is None:
+                directions = seen_directions[col_key] = set()
+            elif direction in directions:
                 continue
-            seen_keys.add(key)
+            directions.add(direction)
+            add_item((col, direction))
+
+        for sort_idx, (col, direction) in enumerate(sort_items):
             sort_id = f"{viz_obj_id}:sort:{sort_idx}"
-            sort_idx += 1
             sort_name = f"Sort: {col} ({direction})"
             sort_obj = ExtractedObject(
                 object_id=sort_id,
-                object_type=ObjectType.SORT,
+                object_type=_OBJ_SORT,
                 name=sort_name,
                 parent_id=viz_obj_id,
                 properties={
@@ -712,7 +893,7 @@ class DashboardExtractor(BaseExtractor):
                 Relationship(
                     source_id=viz_obj_id,
                     target_id=sort_id,
-                    relationship_type=RelationshipType.CONTAINS,
+                    relationship_type=_REL_CONTAINS,
                     properties={"containment_type": "widget_sort"},
                 )
             )
@@ -721,7 +902,7 @@ class DashboardExtractor(BaseExtractor):
 
     def _extract_dashboard_filters(
         self,
-        json_content: str,
+        spec: Dict[str, Any],
         dashboard_id: str,
         dashboard_name: str
     ) -> tuple[List[ExtractedObject], List[Relationship], List[ParseError]]:
@@ -735,272 +916,226 @@ class DashboardExtractor(BaseExtractor):
         objects: List[ExtractedObject] = []
         relationships: List[Relationship] = []
         errors: List[ParseError] = []
-        try:
-            spec = json.loads(json_content)
-        except json.JSONDecodeError as e:
-            errors.append(self._create_error(
-                level="warning",
-                message=f"Failed to parse dashboard JSON for filters: {str(e)}"
-            ))
-            return objects, relationships, errors
 
         page_context = spec.get("pageContext")
-        if not isinstance(page_context, list):
+        if type(page_context) is not list:
             return objects, relationships, errors
 
-        filter_idx = 0
-        for ctx in page_context:
-            if not isinstance(ctx, dict):
-                continue
-            if ctx.get("origin") != "filter":
-                continue
-            filter_idx += 1
+        # Bound once for the per-filter loop
+        create_object = self._create_object
+        create_relationship = self._create_relationship
+        # Only filter-origin entries become filters; selections/parameters are skipped up front
+        filter_ctxs = [c for c in page_context if type(c) is dict and c.get("origin") == "filter"]
+        for filter_idx, ctx in enumerate(filter_ctxs, start=1):
             filter_id = f"{dashboard_id}:pageContext_filter:{filter_idx}"
-            hierarchy_names = ctx.get("hierarchyNames") or []
-            scope = ctx.get("scope") or ""
-            name_parts = list(hierarchy_names)[:3] if hierarchy_names else [f"Filter_{filter_idx}"]
-            filter_name = ", ".join(str(n) for n in name_parts) if name_parts else f"Filter_{filter_idx}"
+            get = ctx.get  # bound once; every filter property below reads ctx
+            hierarchy_names = get("hierarchyNames") or []
+            scope = get("scope") or ""
+            if hierarchy_names:
+                # Named after the first three hierarchies (slice lists directly, no full copy)
+                name_parts = hierarchy_names[:3] if type(hierarchy_names) is list else list(hierarchy_names)[:3]
+                filter_name = ", ".join([str(n) for n in name_parts])
+            else:
+                filter_name = f"Filter_{filter_idx}"
 
             # Build properties (truncate large tupleSet for storage)
             props: Dict[str, Any] = {
-                "filter_scope": "dashboard_pageContext",
+                **_FILTER_PROPS_BASE,
                 "scope": scope,
                 "hierarchyNames": hierarchy_names,
-                "hierarchyUniqueNames": ctx.get("hierarchyUniqueNames") or [],
-                "sourceId": ctx.get("sourceId"),
-                "exclude": ctx.get("exclude", False),
-                "isNamedSet": ctx.get("isNamedSet", False),
+                "hierarchyUniqueNames": get("hierarchyUniqueNames") or [],
+                "sourceId": get("sourceId"),
+                "exclude": get("exclude", False),
+                "isNamedSet": get("isNamedSet", False),
                 "parent_id": dashboard_id,
                 "cognosClass": "filter",
             }
-            conditions = ctx.get("conditions")
+            conditions = get("conditions")
             if conditions is not None:
                 props["conditions"] = conditions
-            tuple_set = ctx.get("tupleSet")
+            tuple_set = get("tupleSet")
             if tuple_set is not None:
-                s = tuple_set if isinstance(tuple_set, str) else str(tuple_set)
+                s = tuple_set if type(tuple_set) is str else _str_prefix(tuple_set, 2000)
                 props["tupleSet"] = s if len(s) <= 2000 else s[:2000] + "…"
 
-            filter_obj = self._create_object(
+            filter_obj = create_object(
                 object_id=filter_id,
                 name=filter_name,
                 parent_id=dashboard_id,
                 properties=props,
             )
-            filter_obj.object_type = ObjectType.FILTER
+            filter_obj.object_type = _OBJ_FILTER
             objects.append(filter_obj)
-            rel = self._create_relationship(
+            rel = create_relationship(
                 source_id=dashboard_id,
                 target_id=filter_id,
-                relationship_type=RelationshipType.FILTERS_BY
+                relationship_type=_REL_FILTERS_BY
             )
             relationships.append(rel)
 
         return objects, relationships, errors
 
-    def _extract_tabs(
+    def _extract_tabs_and_widgets(
         self,
-        json_content: str,
+        spec: Dict[str, Any],
         dashboard_id: str,
         dashboard_name: str
     ) -> tuple[List[ExtractedObject], List[Relationship], List[ParseError]]:
         """
-        Extract tab elements from dashboard JSON specification.
+        Extract tabs and visualization widgets from dashboard JSON specification.
         
         Tabs are structural elements within dashboards that organize visualizations.
         The JSON structure typically has:
         - layout.tabs: Array of tab objects with id, name, and widget references
         
+        A single pass over the tabs builds the tab objects and the widget-to-tab
+        mapping that parents the visualizations extracted afterwards.
+        
         Args:
-            json_content: The dashboard specification JSON string
+            spec: The parsed dashboard specification JSON
             dashboard_id: Parent dashboard ID
             dashboard_name: Parent dashboard name for context
             
         Returns:
             Tuple of (objects, relationships, errors)
         """
-        objects = []
-        relationships = []
-        errors = []
-        
-        try:
-            spec = json.loads(json_content)
-        except json.JSONDecodeError as e:
-            errors.append(self._create_error(
-                level="warning",
-                message=f"Failed to parse dashboard JSON for tabs: {str(e)}"
-            ))
-            return objects, relationships, errors
-        
-        # Extract layout structure
-        layout = spec.get("layout", {})
-        
-        # Check for tabs in layout
-        tabs_data = layout.get("tabs", [])
-        if not tabs_data and isinstance(layout, dict):
-            # Sometimes tabs might be at root level or in a different structure
-            # Check for tab-like structures
-            for key in ["tabPages", "pages", "sections"]:
-                if key in layout:
-                    tabs_data = layout[key]
-                    break
-            
-            # Check for tabs in layout.items where items have type="container" and title
-            # This is a common structure where tabs are containers within the layout
-            if not tabs_data and "items" in layout:
-                items = layout.get("items", [])
-                if isinstance(items, list):
-                    # Filter for items that are containers with titles (these are tabs)
-                    container_items = [
-                        item for item in items
-                        if isinstance(item, dict) and 
-                        item.get("type") == "container" and 
-                        ("title" in item or item.get("name"))
-                    ]
-                    if container_items:
-                        tabs_data = container_items
-        
-        # If tabs_data is a dict, convert to list
-        if isinstance(tabs_data, dict):
-            tabs_data = [tabs_data]
+        objects: List[ExtractedObject] = []
+        relationships: List[Relationship] = []
+        errors: List[ParseError] = []
+        widget_to_tab: Dict[str, str] = {}  # Map widget_id -> tab_id
+        widget_obj_ids: Dict[str, str] = {}  # Map widget_id -> visualization object ID
         
-        if not isinstance(tabs_data, list):
-            # No tabs found
+        # Absent or empty layout/widgets/dataSources leave nothing to walk;
+        # checking them up front skips the helpers on minimal dashboards
+        has_layout = spec.get("layout", {}) != {}
+        has_widgets = spec.get("widgets", {}) != {} or spec.get("dataSources", {}) != {}
+        if not (has_layout or has_widgets):
+            logger.debug(f"Dashboard {dashboard_id} has no layout or widgets, skipping specification walk")
             return objects, relationships, errors
         
-        # Extract widget references for linking tabs to visualizations
-        widgets = spec.get("widgets", {})
-        widget_to_tab = {}  # Map widget_id -> tab_id
-        
-        # Process each tab
-        for tab_idx, tab_data in enumerate(tabs_data):
-            try:
-                # Get tab identifier
-                tab_id_raw = tab_data.get("id") or tab_data.get("identifier") or str(tab_idx)
-                
-                # Get tab name - can be in "name" or "title" field
-                tab_name = None
-                tab_name_data = tab_data.get("name") or tab_data.get("title", {})
-                
-                if isinstance(tab_name_data, dict):
-                    trans_table = tab_name_data.get("translationTable", {})
-                    tab_name = trans_table.get("Default") or trans_table.get("en-us") or trans_table.get("en")
-                    if not tab_name and trans_table:
-                        # Get first available translation
-                        tab_name = next(iter(trans_table.values()), None)
-                elif isinstance(tab_name_data, str):
-                    tab_name = tab_name_data
-                
-                if not tab_name or tab_name == "{}":
-                    tab_name = f"Tab {tab_idx + 1}"
-                
-                # Create unique tab object ID
-                tab_id = f"{dashboard_id}:tab:{tab_id_raw}"
-                
-                # Extract widget references from this tab
-                widget_refs = []
-                
-                # Check for widgets in tab structure
-                tab_widgets = tab_data.get("widgets", [])
-                if isinstance(tab_widgets, list):
-                    widget_refs.extend(tab_widgets)
-                elif isinstance(tab_widgets, dict):
-                    widget_refs.extend(tab_widgets.keys())
-                
-                # Also check for widget references in layout structure
-                layout_widgets = tab_data.get("layout", {}).get("widgets", [])
-                if layout_widgets:
-                    widget_refs.extend(layout_widgets)
-                
-                # Recursively extract widget IDs from nested items structure
-                # Widgets can be nested in items arrays with type="widget"
-                def extract_widget_ids_from_items(items_data):
-                    """Recursively extract widget IDs from nested items structure."""
-                    widget_ids = []
-                    if isinstance(items_data, list):
-                        for item in items_data:
-                            if isinstance(item, dict):
-                                # If item is a widget, extract its ID
-                                if item.get("type") == "widget":
-                                    widget_id = item.get("id")
-                                    if widget_id:
-                                        widget_ids.append(widget_id)
-                                # Recursively check nested items
-                                if "items" in item:
-                                    widget_ids.extend(extract_widget_ids_from_items(item["items"]))
-                    elif isinstance(items_data, dict):
-                        if items_data.get("type") == "widget":
-                            widget_id = items_data.get("id")
-                            if widget_id:
-                                widget_ids.append(widget_id)
-                        if "items" in items_data:
-                            widget_ids.extend(extract_widget_ids_from_items(items_data["items"]))
-                    return widget_ids
-                
-                # Extract widgets from tab's items structure
-                tab_items = tab_data.get("items", [])
-                if tab_items:
-                    extracted_widget_ids = extract_widget_ids_from_items(tab_items)
-                    widget_refs.extend(extracted_widget_ids)
-                
-                # Create tab object
-                tab_obj = self._create_object(
-                    object_id=tab_id,
-                    name=tab_name,
-                    parent_id=dashboard_id,
-                    properties={
-                        "cognosClass": "tab",
-                        "original_id": tab_id_raw,
-                        "widget_count": len(widget_refs),
-                        "widget_refs": widget_refs[:10]  # Store first 10 for reference
-                    }
-                )
-                tab_obj.object_type = ObjectType.TAB
-                objects.append(tab_obj)
-                
-                # Create CONTAINS relationship (dashboard -> tab)
-                rel = self._create_relationship(
-                    source_id=dashboard_id,
-                    target_id=tab_id,
-                    relationship_type=RelationshipType.CONTAINS,
-                    properties={
-                        "containment_type": "dashboard_tab",
-                        "tab_index": tab_idx
-                    }
-                )
-                relationships.append(rel)
-                
-                # Create relationships from tab to visualizations (widgets)
-                for widget_ref in widget_refs:
-                    widget_id_str = str(widget_ref)
-                    viz_obj_id = f"{dashboard_id}:widget:{widget_id_str}"
+        tabs_data = self._find_tabs(spec) if has_layout else None
+        if type(tabs_data) is list:
+            # Bound once for the per-tab / per-widget-reference loops
+            create_object = self._create_object
+            create_relationship = self._create_relationship
+            create_relationships = self._create_relationships
+            map_tab_widgets = self._map_tab_widgets
+            widget_id_prefix = f"{dashboard_id}:widget:"
+            # Process each tab
+            for tab_idx, tab_data in enumerate(tabs_data):
+                try:
+                    # Map the tab's widgets first; visualizations are parented from this
+                    # mapping even when building the tab object below fails
+                    item_widget_ids = None
+                    if type(tab_data) is dict:
+                        item_widget_ids = map_tab_widgets(tab_data, dashboard_id, widget_to_tab)
                     
-                    # Check if visualization exists (will be created by _extract_visualizations)
-                    # Create CONTAINS relationship (tab -> visualization)
-                    rel_viz = self._create_relationship(
-                        source_id=tab_id,
-                        target_id=viz_obj_id,
-                        relationship_type=RelationshipType.CONTAINS,
-                        properties={
-                            "containment_type": "tab_visualization",
+                    # Get tab identifier
+                    tab_id_raw = tab_data.get("id") or tab_data.get("identifier") or str(tab_idx)
+                    
+                    # Get tab name - can be in "name" or "title" field
+                    tab_name = None
+                    tab_name_data = tab_data.get("name") or tab_data.get("title")
+                    
+                    if type(tab_name_data) is dict:
+                        trans_table = tab_name_data.get("translationTable", _EMPTY_MAPPING)
+                        tab_name = trans_table.get("Default") or trans_table.get("en-us") or trans_table.get("en")
+                        if not tab_name and trans_table:
+                            # Get first available translation
+                            tab_name = next(iter(trans_table.values()), None)
+                    elif type(tab_name_data) is str:
+                        tab_name = tab_name_data
+                    
+                    if not tab_name or tab_name == "{}":
+                        tab_name = f"Tab {tab_idx + 1}"
+                    
+                    # Create unique tab object ID
+                    tab_id = f"{dashboard_id}:tab:{tab_id_raw}"
+                    
+                    # Widget references of this tab: its widgets list/dict, its layout
+                    # widgets, then the widget IDs nested in its items structure
+                    tab_widgets = tab_data.get("widgets", [])
+                    if type(tab_widgets) is list:
+                        tab_widget_refs = tab_widgets
+                    elif type(tab_widgets) is dict:
+                        tab_widget_refs = tab_widgets.keys()
+                    else:
+                        tab_widget_refs = ()
+                    layout_widgets = tab_data.get("layout", {}).get("widgets", []) or ()
+                    
+                    # Stream the references: count them, keep the first 10 for the tab
+                    # properties and build the tab -> visualization relationships as we go
+                    widget_count = 0
+                    widget_refs_head: List[Any] = []
+                    widget_targets: List[Tuple[str, Dict[str, Any]]] = []
+                    for widget_ref in chain(tab_widget_refs, layout_widgets, item_widget_ids or ()):
+                        widget_count += 1
+                        if widget_count <= 10:
+                            widget_refs_head.append(widget_ref)
+                        widget_id_str = widget_ref if type(widget_ref) is str else str(widget_ref)
+                        # A widget can be referenced from several tabs/places; build its ID once
+                        viz_obj_id = widget_obj_ids.get(widget_id_str)
+                        if viz_obj_id is None:
+                            viz_obj_id = widget_obj_ids[widget_id_str] = widget_id_prefix + widget_id_str
+                        
+                        # Visualization objects are created by _extract_visualizations
+                        widget_targets.append((viz_obj_id, {
+                            **_TAB_WIDGET_REL_PROPS_BASE,
                             "widget_ref": widget_id_str
+                        }))
+                    
+                    # Create CONTAINS relationships (tab -> visualization) in one batch
+                    widget_rels = create_relationships(tab_id, widget_targets, _REL_CONTAINS)
+                    
+                    # Create tab object
+                    tab_obj = create_object(
+                        object_id=tab_id,
+                        name=tab_name,
+                        parent_id=dashboard_id,
+                        properties={
+                            **_TAB_PROPS_BASE,
+                            "original_id": tab_id_raw,
+                            "widget_count": widget_count,
+                            "widget_refs": widget_refs_head  # First 10 for reference
                         }
                     )
-                    relationships.append(rel_viz)
+                    tab_obj.object_type = _OBJ_TAB
+                    objects.append(tab_obj)
                     
-                    # Track widget to tab mapping
-                    widget_to_tab[widget_id_str] = tab_id
+                    # Create CONTAINS relationship (dashboard -> tab)
+                    rel = create_relationship(
+                        source_id=dashboard_id,
+                        target_id=tab_id,
+                        relationship_type=_REL_CONTAINS,
+                        properties={
+                            **_TAB_REL_PROPS_BASE,
+                            "tab_index": tab_idx
+                        }
+                    )
+                    relationships.append(rel)
+                    relationships.extend(widget_rels)
                     
-            except Exception as e:
-                logger.debug(f"Error extracting tab {tab_idx}: {e}")
-                errors.append(self._create_error(
-                    level="warning",
-                    message=f"Failed to extract tab {tab_idx}: {str(e)}"
-                ))
-                continue
+                except Exception as e:
+                    # A malformed tab entry (e.g. not an object) only drops that tab;
+                    # the dashboard, other tabs and all widgets are still extracted
+                    logger.debug(f"Error extracting tab {tab_idx}: {e}")
+                    errors.append(self._create_error(
+                        level="warning",
+                        message=f"Failed to extract tab {tab_idx}: {str(e)}"
+                    ))
+                    continue
         
-        # Widget-to-tab mapping is handled via relationships created above
-        # No need to store separately as relationships provide the linkage
+        # Extract visualizations (widgets), parented by tab where mapped
+        if has_widgets:
+            viz_objects, viz_rels, viz_errors = self._extract_visualizations(
+                spec,
+                widget_to_tab,
+                dashboard_id=dashboard_id,
+                dashboard_name=dashboard_name,
+                widget_obj_ids=widget_obj_ids
+            )
+            objects.extend(viz_objects)
+            relationships.extend(viz_rels)
+            errors.extend(viz_errors)
         
         return objects, relationships, errors
-    
\ No newline at end of file
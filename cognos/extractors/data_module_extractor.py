@@ -10,16 +10,23 @@ Enhanced extractor that captures:
 - Hierarchies
 - Data source connections
 """
-from typing import List, Any, Dict, Optional, Set, Tuple
-from datetime import datetime
+from pathlib import Path
+from typing import List, Any, Dict, Iterator, Optional, Set, Tuple, Union
 import re
+import json
 import logging
 import base64
 import gzip
-import io
+
+try:
+    # Optional: orjson parses large smartsData blobs several times faster (accepts str or UTF-8 bytes)
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 from ...core import BaseExtractor, ExtractedObject, Relationship, ParseError, ObjectType, RelationshipType
 from ...core.handlers import XmlHandler
+from . import intern_label, parse_timestamp
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +35,24 @@ logger = logging.getLogger(__name__)
 # Sub-modules (smartsModule, modelView, dataSet2) are children or views and are not "main" modules.
 MAIN_MODULE_COGNOS_CLASSES = frozenset({"module", "dataModule", "model"})
 
+# All Cognos classes CognosParser routes to this extractor (main modules and sub-modules)
+_DATA_MODULE_CLASSES = frozenset({"dataModule", "smartsModule", "module", "model", "modelView", "dataSet2"})
+
+# Top-level child paths read by DataModuleExtractor.extract (one find_many pass over the object)
+_SOURCE_PATHS = ("id", "name", "parentId", "storeID", "class", "props")
+
+# props paths read by DataModuleExtractor.extract (resolved together via XmlHandler.find_many)
+_PROPS_PATHS = (
+    "creationTime/value",
+    "modificationTime/value",
+    "owner/value/item/searchPath/value",
+    "displaySequence/value",
+    "hidden/value",
+    "tenantID/value",
+    "smartsData",
+    "tags/value",
+)
+
 # Cognos RS_dataType mapping to standard data types
 DATA_TYPE_MAP = {
     "1": "boolean",
@@ -60,6 +85,48 @@ AGGREGATION_MAP = {
     "maximum": "maximum",
 }
 
+# Usage values seen in smartsData JSON (string and numeric Cognos codes: 0=attr, 1=dim, 2=measure,
+# plus usage names) -> data_usage, so the common cases are one dict lookup
+_DATA_USAGE_LOOKUP = {
+    None: "unknown",
+    **DATA_USAGE_MAP,
+    0: "attribute",
+    1: "dimension",
+    2: "measure",
+    "fact": "measure",
+    "measure": "measure",
+    "attribute": "attribute",
+    "dimension": "dimension",
+}
+
+
+def _map_data_usage(usage: Any) -> str:
+    """Map a smartsData usage value (string or numeric code, or usage name) to data_usage."""
+    if usage is None or type(usage) is str or type(usage) is int:
+        data_usage = _DATA_USAGE_LOOKUP.get(usage)
+        if data_usage is not None:
+            return data_usage
+    # Padded codes (" 1"), floats/bools and unrecognized values
+    usage_str = str(usage).strip()
+    data_usage = DATA_USAGE_MAP.get(usage_str, "unknown")
+    if data_usage == "unknown" and usage_str:
+        if usage in ("fact", "measure") or usage == 2:
+            data_usage = "measure"
+        elif usage in ("attribute", "dimension") or usage in (0, 1):
+            data_usage = "dimension" if usage in (1, "dimension") else "attribute"
+    return data_usage
+
+
+def _map_data_type(datatype: Any) -> Any:
+    """Map a smartsData datatype code ("3") to a data type name; other values pass through."""
+    if not datatype:
+        return "unknown"
+    if type(datatype) is str:
+        # Only digit codes are DATA_TYPE_MAP keys; anything else maps to itself
+        return DATA_TYPE_MAP.get(datatype, datatype)
+    return datatype
+
+
 # Patterns that indicate a dataItem expression is an actual calculated field (user-defined expression),
 # not a simple column reference or a simple aggregation. Used to avoid double-extraction and over-counting.
 # Excludes: simple aggregates like SUM([Col]), COUNT([Col]), AVG([Col]) — those are measures, not calculations.
@@ -94,6 +161,15 @@ CALC_EXPRESSION_PATTERNS = (
 )
 _CALC_EXPRESSION_REGEX = re.compile('|'.join(CALC_EXPRESSION_PATTERNS), re.IGNORECASE)
 
+# Arithmetic operators are checked with plain substring tests before the regex runs;
+# the keyword/function alternatives (everything but the operator class) are searched only
+# when no operator is present. Not re.ASCII: Unicode \b/IGNORECASE semantics must match
+# _CALC_EXPRESSION_REGEX (e.g. "éabs(" is not a calculation)
+_CALC_ARITHMETIC_OPERATORS = ("+", "-", "*", "/")
+_CALC_KEYWORD_REGEX_SEARCH = re.compile(
+    '|'.join(p for p in CALC_EXPRESSION_PATTERNS if p != r'[\+\-\*\/]'), re.IGNORECASE
+).search
+
 # Cognos often uses leading underscore for calculated/system items (e.g. _days_to_end_of_month, _first_of_month)
 def _name_looks_like_calculated_field(name: Optional[str]) -> bool:
     """True if name suggests a calculated field (e.g. Cognos convention: leading underscore)."""
@@ -107,7 +183,11 @@ def _expression_is_calculated_field(expression: Optional[str]) -> bool:
     """Return True if the expression indicates a calculated field (not a simple column reference)."""
     if not expression or not isinstance(expression, str):
         return False
-    return bool(_CALC_EXPRESSION_REGEX.search(expression.strip()))
+    # No strip(): leading/trailing whitespace never changes whether a pattern is found
+    for op in _CALC_ARITHMETIC_OPERATORS:
+        if op in expression:
+            return True
+    return _CALC_KEYWORD_REGEX_SEARCH(expression) is not None
 
 
 # Pattern: expression is only a single [connection].[table].[column] reference (no actual calculation)
@@ -156,6 +236,27 @@ class DataModuleExtractor(BaseExtractor):
     def object_type(self) -> str:
         return ObjectType.DATA_MODULE.value
     
+    def extract_stream(
+        self,
+        xml_path: Union[str, Path]
+    ) -> Iterator[Tuple[List[ExtractedObject], List[Relationship], List[ParseError]]]:
+        """
+        Extract the data modules of a package/dataSource XML file while streaming it.
+        
+        Objects are read with iterparse and cleared once extracted, so only
+        the current object (and its smartsData blob) is held in memory rather
+        than the whole export tree.
+        
+        Args:
+            xml_path: Path to a package or dataSource XML file
+        
+        Yields:
+            (objects, relationships, errors) per data module object, in file order
+        """
+        for obj_elem in XmlHandler.iter_elements(xml_path, "object"):
+            if XmlHandler.get_text(obj_elem, "class") in _DATA_MODULE_CLASSES:
+                yield self.extract(obj_elem)
+    
     def extract(
         self,
         source: Any
@@ -174,16 +275,17 @@ class DataModuleExtractor(BaseExtractor):
         errors = []
         
         try:
-            # Get basic info
-            obj_id = XmlHandler.get_text(source, "id")
-            name = XmlHandler.get_text(source, "name", default="<unnamed>")
-            parent_id = XmlHandler.get_text(source, "parentId")
-            store_id = XmlHandler.get_text(source, "storeID")
-            obj_class = XmlHandler.get_text(source, "class")
+            # Get basic info (children indexed once instead of one scan per field)
+            top = XmlHandler.find_many(source, _SOURCE_PATHS)
+            obj_id = XmlHandler.get_text(top["id"])
+            name = XmlHandler.get_text(top["name"], default="<unnamed>")
+            parent_id = XmlHandler.get_text(top["parentId"])
+            store_id = XmlHandler.get_text(top["storeID"])
+            obj_class = XmlHandler.get_text(top["class"])
             is_main_module = obj_class in MAIN_MODULE_COGNOS_CLASSES
 
             # Get properties
-            props_elem = source.find("props")
+            props_elem = top["props"]
             properties = {
                 "storeID": store_id,
                 "cognosClass": obj_class,
@@ -197,57 +299,47 @@ class DataModuleExtractor(BaseExtractor):
             # Statistics for this module
             table_count = 0
             column_count = 0
-            calculated_field_count = 0
-            filter_count = 0
+            calculated_field_count = 0  # counted as smartsData calculations are extracted
+            filter_count = 0  # module objects carry no filters (tags only add tables/columns)
             
             if props_elem is not None:
+                # Look up every props path we need in one pass over props_elem
+                found = XmlHandler.find_many(props_elem, _PROPS_PATHS)
+                
                 # Extract timestamps
-                creation_time_str = XmlHandler.get_text(
-                    props_elem,
-                    "creationTime/value"
-                )
-                mod_time_str = XmlHandler.get_text(
-                    props_elem,
-                    "modificationTime/value"
-                )
+                creation_time_str = XmlHandler.get_text(found["creationTime/value"])
+                mod_time_str = XmlHandler.get_text(found["modificationTime/value"])
                 
                 if creation_time_str:
                     try:
-                        created_at = datetime.fromisoformat(
-                            creation_time_str.replace('Z', '+00:00')
-                        )
+                        created_at = parse_timestamp(creation_time_str)
                         properties["creationTime"] = creation_time_str
                     except ValueError:
                         pass
                 
                 if mod_time_str:
                     try:
-                        modified_at = datetime.fromisoformat(
-                            mod_time_str.replace('Z', '+00:00')
-                        )
+                        modified_at = parse_timestamp(mod_time_str)
                         properties["modificationTime"] = mod_time_str
                     except ValueError:
                         pass
                 
                 # Extract owner
-                owner = XmlHandler.get_text(
-                    props_elem,
-                    "owner/value/item/searchPath/value"
-                )
+                owner = XmlHandler.get_text(found["owner/value/item/searchPath/value"])
                 if owner:
                     properties["owner"] = owner
 
                 # Optional props (display, tenant)
-                display_seq = XmlHandler.get_text(props_elem, "displaySequence/value")
+                display_seq = XmlHandler.get_text(found["displaySequence/value"])
                 if display_seq is not None:
                     try:
                         properties["displaySequence"] = int(display_seq)
                     except (ValueError, TypeError):
                         pass
-                hidden = XmlHandler.get_text(props_elem, "hidden/value")
+                hidden = XmlHandler.get_text(found["hidden/value"])
                 if hidden:
                     properties["hidden"] = hidden.lower() == "true"
-                tenant_id = XmlHandler.get_text(props_elem, "tenantID/value")
+                tenant_id = XmlHandler.get_text(found["tenantID/value"])
                 if tenant_id:
                     properties["tenantID"] = tenant_id
                 
@@ -255,34 +347,28 @@ class DataModuleExtractor(BaseExtractor):
                 smarts_columns_by_path = {}  # Map full_path -> column object
                 smarts_tables_by_name = {}  # Map table_name -> table object
                 
-                smarts_data_elem = props_elem.find("smartsData")
+                smarts_data_elem = found["smartsData"]
                 if smarts_data_elem is not None:
-                    smarts_objects, smarts_rels, smarts_errors, smarts_tables, smarts_columns = self._extract_smarts_data(
-                        smarts_data_elem, obj_id, name, is_main_module
+                    # Objects/relationships are appended straight onto ours; lookup maps for
+                    # matching come back already built (tables and columns are deduplicated
+                    # by ID, so each has one entry)
+                    objects_before = len(objects)
+                    smarts_errors, smarts_tables_by_name, smarts_columns_by_path = self._extract_smarts_data(
+                        smarts_data_elem, obj_id, name, is_main_module,
+                        objects=objects, relationships=relationships
                     )
-                    objects.extend(smarts_objects)
-                    relationships.extend(smarts_rels)
                     errors.extend(smarts_errors)
                     
-                    # Build lookup maps for matching
-                    for col in smarts_columns:
-                        full_path = col.properties.get('full_path') or f"{col.properties.get('table', '')}.{col.name}"
-                        smarts_columns_by_path[full_path] = col
-                    
-                    for table in smarts_tables:
-                        smarts_tables_by_name[table.name] = table
-                    
-                    table_count = len(smarts_tables)
-                    column_count = len(smarts_columns)
+                    # The only objects _extract_smarts_data emits are embedded calculations
+                    # (CALCULATED_FIELD); its tables/columns come back in the lookup maps
+                    calculated_field_count = len(objects) - objects_before
+                    table_count = len(smarts_tables_by_name)
+                    column_count = len(smarts_columns_by_path)
                 
                 # Extract tables and columns from tags (may have columns not in smartsData)
-                tags_elem = props_elem.find("tags/value")
-                if tags_elem is None:
-                    tags_container = props_elem.find("tags")
-                    if tags_container is not None:
-                        tags_elem = tags_container.find("value")
+                tags_elem = found["tags/value"]
                 if tags_elem is not None:
-                    tables, columns, table_rels, column_rels = self._extract_tables_and_columns(
+                    tables, columns, table_rels_by_target, column_rels_by_target = self._extract_tables_and_columns(
                         tags_elem, obj_id, name, smarts_columns_by_path, smarts_tables_by_name
                     )
                     
@@ -290,7 +376,7 @@ class DataModuleExtractor(BaseExtractor):
                     for table in tables:
                         if table.name not in smarts_tables_by_name:
                             objects.append(table)
-                            relationships.extend([r for r in table_rels if r.target_id == table.object_id])
+                            relationships.extend(table_rels_by_target.get(table.object_id, ()))
                             table_count += 1
                     
                     # Add/enrich columns from tags
@@ -305,13 +391,9 @@ class DataModuleExtractor(BaseExtractor):
                         else:
                             # Column only in tags, add it (no metadata but still valid)
                             objects.append(col)
-                            relationships.extend([r for r in column_rels if r.target_id == col.object_id])
+                            relationships.extend(column_rels_by_target.get(col.object_id, ()))
                             column_count += 1
             
-            # Count calculated fields and filters from extracted objects
-            calculated_field_count = sum(1 for obj in objects if obj.object_type == ObjectType.CALCULATED_FIELD)
-            filter_count = sum(1 for obj in objects if obj.object_type == ObjectType.FILTER)
-            
             # Store statistics in properties
             properties["table_count"] = table_count
             properties["column_count"] = column_count
@@ -359,7 +441,10 @@ class DataModuleExtractor(BaseExtractor):
         module_name: str,
         smarts_columns_by_path: Optional[Dict[str, ExtractedObject]] = None,
         smarts_tables_by_name: Optional[Dict[str, ExtractedObject]] = None
-    ) -> Tuple[List[ExtractedObject], List[ExtractedObject], List[Relationship], List[Relationship]]:
+    ) -> Tuple[
+        List[ExtractedObject], List[ExtractedObject],
+        Dict[str, List[Relationship]], Dict[str, List[Relationship]]
+    ]:
         """
         Extract tables and columns from tags element.
         
@@ -373,7 +458,8 @@ class DataModuleExtractor(BaseExtractor):
             smarts_tables_by_name: Optional dict mapping table_name -> table from smartsData
         
         Returns:
-            Tuple of (tables, columns, table_relationships, column_relationships)
+            Tuple of (tables, columns, table_rels_by_target, column_rels_by_target);
+            the relationship maps group relationships by target (table/column) ID
         """
         if smarts_columns_by_path is None:
             smarts_columns_by_path = {}
@@ -382,22 +468,22 @@ class DataModuleExtractor(BaseExtractor):
         
         tables = []
         columns = []
-        table_rels = []
-        column_rels = []
+        table_rels_by_target: Dict[str, List[Relationship]] = {}
+        column_rels_by_target: Dict[str, List[Relationship]] = {}
         
         # Track unique tables
         table_map: Dict[str, ExtractedObject] = {}
         
         for item in tags_elem.findall("item"):
-            if item.text:
-                tag_value = item.text.strip()
+            text = item.text
+            if text:
+                tag_value = text.strip()
                 
-                if '.' in tag_value:
+                # One partition call splits "Table.Column" (no '.': just a table name)
+                table_name, dot, column_name = tag_value.partition('.')
+                table_name = intern_label(table_name)
+                if dot:
                     # Format: Table.Column
-                    parts = tag_value.split('.', 1)
-                    table_name = parts[0]
-                    column_name = parts[1] if len(parts) > 1 else None
-                    
                     # Check if table exists in smartsData
                     if table_name in smarts_tables_by_name:
                         # Table already extracted from smartsData, use that
@@ -424,7 +510,7 @@ class DataModuleExtractor(BaseExtractor):
                             target_id=table_id,
                             relationship_type=RelationshipType.CONTAINS
                         )
-                        table_rels.append(rel)
+                        table_rels_by_target.setdefault(table_id, []).append(rel)
                     
                     # Create column if column name exists and not in smartsData
                     if column_name:
@@ -456,19 +542,19 @@ class DataModuleExtractor(BaseExtractor):
                                 target_id=column_id,
                                 relationship_type=RelationshipType.HAS_COLUMN
                             )
-                            column_rels.append(rel)
+                            column_rels_by_target.setdefault(column_id, []).append(rel)
                 else:
-                    # Just table name, no column
+                    # Just table name, no column (table_name is the whole tag)
                     # Check if table exists in smartsData
-                    if tag_value in smarts_tables_by_name:
+                    if table_name in smarts_tables_by_name:
                         # Table already extracted from smartsData
-                        table_map[tag_value] = smarts_tables_by_name[tag_value]
-                    elif tag_value not in table_map:
+                        table_map[table_name] = smarts_tables_by_name[table_name]
+                    elif table_name not in table_map:
                         # Create table if not exists
-                        table_id = f"{module_id}:table:{tag_value}"
+                        table_id = f"{module_id}:table:{table_name}"
                         table_obj = self._create_object(
                             object_id=table_id,
-                            name=tag_value,
+                            name=table_name,
                             parent_id=module_id,
                             properties={
                                 "cognosClass": "querySubject",
@@ -476,7 +562,7 @@ class DataModuleExtractor(BaseExtractor):
                             }
                         )
                         table_obj.object_type = ObjectType.TABLE
-                        table_map[tag_value] = table_obj
+                        table_map[table_name] = table_obj
                         tables.append(table_obj)
                         
                         # Create CONTAINS relationship
@@ -485,9 +571,9 @@ class DataModuleExtractor(BaseExtractor):
                             target_id=table_id,
                             relationship_type=RelationshipType.CONTAINS
                         )
-                        table_rels.append(rel)
+                        table_rels_by_target.setdefault(table_id, []).append(rel)
         
-        return tables, columns, table_rels, column_rels
+        return tables, columns, table_rels_by_target, column_rels_by_target
 
     def _extract_smarts_data(
         self,
@@ -495,7 +581,10 @@ class DataModuleExtractor(BaseExtractor):
         module_id: str,
         module_name: str,
         is_main_module: bool = False,
-    ) -> Tuple[List[ExtractedObject], List[Relationship], List[ParseError], List[ExtractedObject], List[ExtractedObject]]:
+        *,
+        objects: List[ExtractedObject],
+        relationships: List[Relationship],
+    ) -> Tuple[List[ParseError], Dict[str, ExtractedObject], Dict[str, ExtractedObject]]:
         """
         Extract detailed information from smartsData blob.
         
@@ -506,14 +595,18 @@ class DataModuleExtractor(BaseExtractor):
         - dataRetrievalMode (live vs cached)
         - querySubjects (tables) with full column metadata
         - relationships (joins between tables)
-        """
-        import json
         
-        objects = []
-        relationships = []
+        Extracted objects and relationships are appended to the caller's
+        objects/relationships lists (no intermediate lists to copy over).
+        
+        Returns:
+            Tuple of (errors, tables_by_name, columns_by_path); tables_by_name
+            maps table name -> table, columns_by_path maps "Table.Column" ->
+            column, both filled as the objects are created
+        """
         errors = []
-        tables = []
-        columns = []
+        tables_by_name: Dict[str, ExtractedObject] = {}
+        columns_by_path: Dict[str, ExtractedObject] = {}
         
         try:
             # smartsData may contain text content or nested value element
@@ -526,23 +619,30 @@ class DataModuleExtractor(BaseExtractor):
                     content = value_elem.text.strip()
             
             if not content:
-                return objects, relationships, errors, tables, columns
+                return errors, tables_by_name, columns_by_path
             
             # Try gzip+base64 decode (Cognos Trace export often stores smartsData this way)
             if content.strip().startswith("H4sI") or (len(content) > 100 and not content.strip().startswith("{")):
                 try:
                     raw = base64.b64decode(content)
                     if raw[:2] == b"\x1f\x8b":  # gzip magic
-                        content = gzip.GzipFile(fileobj=io.BytesIO(raw), mode="rb").read().decode("utf-8")
+                        # One-shot decompress (no BytesIO/GzipFile stream); kept as bytes since
+                        # the JSON parser reads UTF-8 directly (no decoded copy)
+                        content = gzip.decompress(raw)
                 except Exception:
                     pass
             
             # Try to parse as JSON
             try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
+                try:
+                    data = _json_loads(content)
+                except ValueError:
+                    # orjson rejects some input json accepts (NaN, big ints); gunzipped bytes
+                    # that are not UTF-8 fail to decode here, as the old eager decode did
+                    data = json.loads(content.decode("utf-8") if type(content) is bytes else content)
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 # Not JSON, might be XML blob - skip for now
-                return objects, relationships, errors, tables, columns
+                return errors, tables_by_name, columns_by_path
             
             # Extract moserJSON if present (embedded module definition)
             moser_json = data.get("moserJSON") or data
@@ -588,8 +688,10 @@ class DataModuleExtractor(BaseExtractor):
                 query_subjects = [query_subjects] if query_subjects else []
             seen_table_ids: Set[str] = set()
             seen_column_ids: Set[str] = set()
+            col_id_prefix = f"{module_id}:col:"
             for qs in query_subjects:
-                qs_name = qs.get("name") or qs.get("identifier", "Unknown")
+                # Table names repeat in every column path, join and tag of the module
+                qs_name = intern_label(qs.get("name") or qs.get("identifier", "Unknown"))
                 qs_id = qs.get("id") or qs.get("identifier", "")
                 table_id = f"{module_id}:table:{qs_name}"
                 if table_id in seen_table_ids:
@@ -608,7 +710,7 @@ class DataModuleExtractor(BaseExtractor):
                     }
                 )
                 table_obj.object_type = ObjectType.TABLE
-                tables.append(table_obj)
+                tables_by_name[qs_name] = table_obj
                 
                 # Create CONTAINS relationship
                 rel = self._create_relationship(
@@ -622,35 +724,28 @@ class DataModuleExtractor(BaseExtractor):
                 query_items = qs.get("queryItem", [])
                 if not isinstance(query_items, list):
                     query_items = [query_items] if query_items else []
+                # qs_name is a str here (the table object above validated it), so column
+                # paths/IDs are built by concatenating prefixes made once per table
+                path_prefix = qs_name + "."
                 for qi in query_items:
-                    col_name = qi.get("name") or qi.get("identifier", "Unknown")
-                    col_id = qi.get("id") or qi.get("identifier", "")
-                    column_id = f"{module_id}:col:{qs_name}.{col_name}"
+                    get = qi.get  # bound once; every column property below reads qi
+                    col_name = intern_label(get("name") or get("identifier", "Unknown"))
+                    col_id = get("id") or get("identifier", "")
+                    full_path = path_prefix + col_name if type(col_name) is str else f"{path_prefix}{col_name}"
+                    column_id = col_id_prefix + full_path
                     if column_id in seen_column_ids:
                         continue
                     seen_column_ids.add(column_id)
-                    expression = qi.get("expression", "")
-                    usage = qi.get("usage", "")
-                    datatype = qi.get("datatype", "")
-                    aggregate = qi.get("regularAggregate", "")
+                    expression = get("expression", "")
+                    usage = get("usage", "")
+                    datatype = get("datatype", "")
+                    aggregate = get("regularAggregate", "")
                     
                     # Map usage to data_usage (support both string and numeric Cognos codes: 0=attr, 1=dim, 2=measure)
-                    usage_str = str(usage).strip() if usage is not None else ""
-                    data_usage = DATA_USAGE_MAP.get(usage_str, "unknown")
-                    if data_usage == "unknown" and usage_str:
-                        if usage in ("fact", "measure") or usage == 2:
-                            data_usage = "measure"
-                        elif usage in ("attribute", "dimension") or usage in (0, 1):
-                            data_usage = "dimension" if usage in (1, "dimension") else "attribute"
+                    data_usage = _map_data_usage(usage)
                     
-                    # Map datatype
-                    data_type = "unknown"
-                    if datatype:
-                        # Try to map numeric datatype codes
-                        if isinstance(datatype, str) and datatype.isdigit():
-                            data_type = DATA_TYPE_MAP.get(datatype, datatype)
-                        else:
-                            data_type = datatype
+                    # Map datatype (numeric datatype codes to names)
+                    data_type = _map_data_type(datatype)
                     
                     # Map aggregate (support non-string from JSON)
                     agg_type = "none"
@@ -668,7 +763,7 @@ class DataModuleExtractor(BaseExtractor):
                         parent_id=table_id,
                         properties={
                             "table": qs_name,
-                            "full_path": f"{qs_name}.{col_name}",
+                            "full_path": full_path,
                             "identifier": col_id,
                             "expression": expression,
                             "data_type": data_type,
@@ -693,7 +788,7 @@ class DataModuleExtractor(BaseExtractor):
                     else:
                         column_obj.object_type = ObjectType.COLUMN
                     
-                    columns.append(column_obj)
+                    columns_by_path[full_path] = column_obj
                     
                     # Create HAS_COLUMN relationship
                     rel = self._create_relationship(
@@ -807,21 +902,10 @@ class DataModuleExtractor(BaseExtractor):
                 obj_type = ObjectType.CALCULATED_FIELD
                 
                 # Map datatype to data_type for consistency
-                data_type = "unknown"
-                if datatype:
-                    if isinstance(datatype, str) and datatype.isdigit():
-                        data_type = DATA_TYPE_MAP.get(datatype, datatype)
-                    else:
-                        data_type = datatype
+                data_type = _map_data_type(datatype)
                 
                 # Map usage to data_usage (support string and numeric: 0=attr, 1=dim, 2=measure)
-                usage_str = str(usage).strip() if usage is not None else ""
-                data_usage = DATA_USAGE_MAP.get(usage_str, "unknown")
-                if data_usage == "unknown" and usage_str:
-                    if usage in ("fact", "measure") or usage == 2:
-                        data_usage = "measure"
-                    elif usage in ("attribute", "dimension") or usage in (0, 1):
-                        data_usage = "dimension" if usage in (1, "dimension") else "attribute"
+                data_usage = _map_data_usage(usage)
                 
                 # Map aggregate (support non-string from JSON)
                 agg_type = "none"
@@ -898,7 +982,7 @@ class DataModuleExtractor(BaseExtractor):
                 message=f"Failed to parse smartsData: {str(e)}"
             ))
         
-        return objects, relationships, errors, tables, columns
+        return errors, tables_by_name, columns_by_path
 
     def extract_from_specification(
         self,
@@ -1007,7 +1091,7 @@ class DataModuleExtractor(BaseExtractor):
             if not data_item.tag.endswith('dataItem'):
                 continue
                 
-            name = data_item.get('name')
+            name = intern_label(data_item.get('name'))
             if not name or name in seen_columns:
                 continue
             seen_columns.add(name)
@@ -1049,8 +1133,8 @@ class DataModuleExtractor(BaseExtractor):
                 match = re.match(r'\[([^\]]+)\]\.\[([^\]]+)\]\.\[([^\]]+)\]', expression)
                 if match:
                     # [DataSource].[Table].[Column]
-                    table_name = match.group(2)
-                    source_column = match.group(3)
+                    table_name = intern_label(match.group(2))
+                    source_column = intern_label(match.group(3))
             
             # Normalize aggregate: empty string or missing => 'none' (avoid misclassifying dimensions as measures)
             agg_normalized = (aggregate or "").strip().lower() or "none"
@@ -8,6 +8,7 @@ from typing import List, Any, Dict, Optional, Set
 
 from ...core import BaseExtractor, ExtractedObject, Relationship, ParseError, ObjectType, RelationshipType
 from ...core.handlers import XmlHandler
+from . import intern_label
 
 
 class ReportExtractor(BaseExtractor):
@@ -327,7 +328,7 @@ class ReportExtractor(BaseExtractor):
             # 2. Find Internal Queries (dedupe by query_id so same name = one object)
             seen_query_ids: Set[str] = set()
             for query_elem in root.findall(".//{*}query"):
-                query_name = query_elem.get("name")
+                query_name = intern_label(query_elem.get("name"))
                 if not query_name:
                     continue
                 query_id = f"{report_id}:query:{query_name}"
@@ -522,7 +523,7 @@ class ReportExtractor(BaseExtractor):
                 else:
                     viz_type = "Visualization"
             
-            query_ref = viz_elem.get("refQuery")
+            query_ref = intern_label(viz_elem.get("refQuery"))
             
             create_viz_object(viz_id, viz_name, viz_type, query_ref, "visualization", raw_type)
 
@@ -549,7 +550,7 @@ class ReportExtractor(BaseExtractor):
                 else:
                     viz_type = "Chart"
             
-            query_ref = chart_elem.get("refQuery")
+            query_ref = intern_label(chart_elem.get("refQuery"))
             create_viz_object(viz_id, chart_name, viz_type, query_ref, "chart", chart_type_attr)
 
         # 3. Legacy Containers and Specific Chart Types
@@ -582,7 +583,7 @@ class ReportExtractor(BaseExtractor):
             for i, elem in enumerate(root.findall(f".//{{*}}{tag}")):
                 viz_name = elem.get("name") or f"{type_name} {i+1}"
                 viz_id = f"{report_id}:{tag}:{i}"
-                query_ref = elem.get("refQuery")
+                query_ref = intern_label(elem.get("refQuery"))
                 
                 create_viz_object(viz_id, viz_name, type_name, query_ref, tag)
                     
@@ -2,25 +2,47 @@
 Cognos 11.x Parser Implementation.
 """
 from pathlib import Path
-from typing import Union, List
+from typing import Any, Dict, Union, List
 import logging
 
 from ..core import BaseParser, ParseResult, ParseError, ParseErrorLevel, ObjectType
 from ..core.handlers import ZipHandler, XmlHandler
-from .config import CognosConfig
+from .config import CognosConfig, get_cognos_config
+from .extractors import EXTRACTOR_TABLE
 
 
 logger = logging.getLogger(__name__)
 
+# Extractor class name (key of EXTRACTOR_TABLE) per object type; modules are imported on first use
+_EXTRACTOR_CLASS_NAMES = {
+    ObjectType.FOLDER: "FolderExtractor",
+    ObjectType.REPORT: "ReportExtractor",
+    ObjectType.DASHBOARD: "DashboardExtractor",
+    ObjectType.DATA_MODULE: "DataModuleExtractor",
+    ObjectType.VISUALIZATION: "VisualizationExtractor",
+}
 
-class CognosParser(BaseParser):
+
+class CognosParser(BaseParser, tool_name="cognos"):
     """Parser for IBM Cognos Analytics 11.x exports."""
     
     def __init__(self, config: dict = None):
         """Initialize Cognos parser."""
         super().__init__(config)
-        self.cognos_config = CognosConfig(**(config or {}))
-        self.temp_dir = None
+        # Only CognosConfig fields take part in the cache key; other keys are ignored
+        overrides = {
+            key: value for key, value in (config or {}).items()
+            if key in CognosConfig.field_names()
+        }
+        if overrides:
+            try:
+                self.cognos_config = get_cognos_config(tuple(sorted(overrides.items())))
+            except TypeError:
+                # Unhashable config values can't key the cache; build directly so
+                # the option's own validation error is what surfaces
+                self.cognos_config = CognosConfig(**overrides)
+        else:
+            self.cognos_config = CognosConfig.default()
     
     @property
     def tool_name(self) -> str:
@@ -32,6 +54,14 @@ class CognosParser(BaseParser):
         """Return list of supported Cognos versions."""
         return ["11.0", "11.1", "11.2"]
     
+    @classmethod
+    def describe_capabilities(cls) -> Dict[str, Any]:
+        """Describe the Cognos parser, including extracted object types and config options."""
+        capabilities = super().describe_capabilities()
+        capabilities["object_types"] = [object_type.value for object_type in _EXTRACTOR_CLASS_NAMES]
+        capabilities["config_options"] = sorted(CognosConfig.field_names())
+        return capabilities
+    
     def validate_export(self, file_path: Union[str, Path]) -> bool:
         """
         Validate that the file is a valid Cognos export.
@@ -108,6 +138,8 @@ class CognosParser(BaseParser):
         """
         file_path = Path(file_path)
         result = ParseResult()
+        # Per-call state stays local: create_parser shares one instance between callers
+        extract_dir = None
         
         self._log_progress(f"Starting parse of {file_path.name}", "info")
         
@@ -125,19 +157,19 @@ class CognosParser(BaseParser):
             # Use directory directly or extract ZIP
             if file_path.is_dir():
                 self._log_progress("Using export directory", "info")
-                self.temp_dir = file_path
+                extract_dir = file_path
             else:
                 self._log_progress("Extracting ZIP archive", "info")
-                self.temp_dir = ZipHandler.extract(file_path)
+                extract_dir = ZipHandler.extract(file_path)
             
             # Parse manifest (content.xml) to understand structure
-            self._parse_manifest(self.temp_dir, result)
+            self._parse_manifest(extract_dir, result)
             
             # Parse package files
-            self._parse_packages(self.temp_dir, result)
+            self._parse_packages(extract_dir, result)
             
             # Parse data sources (dataSource.xml)
-            self._parse_data_sources(self.temp_dir, result)
+            self._parse_data_sources(extract_dir, result)
             
             # Post-process: Create CONNECTS_TO relationships from modules to data sources
             self._create_data_source_connections(result)
@@ -163,9 +195,8 @@ class CognosParser(BaseParser):
         
         finally:
             # Cleanup temporary directory
-            if self.temp_dir and self.cognos_config.cleanup_temp:
-                ZipHandler.cleanup(self.temp_dir)
-                self.temp_dir = None
+            if extract_dir and self.cognos_config.cleanup_temp:
+                ZipHandler.cleanup(extract_dir)
         
         return result
     
@@ -189,8 +220,14 @@ class CognosParser(BaseParser):
         if "data_sources_by_store_id" in result.stats:
             data_sources_by_store_id.update(result.stats["data_sources_by_store_id"])
         
+        # (source, target) pairs that already have a CONNECTS_TO relationship
+        connected = {
+            (r.source_id, r.target_id)
+            for r in result.relationships_of_type(RelationshipType.CONNECTS_TO)
+        }
+        
         # Find all USES relationships that reference data sources
-        uses_rels = [r for r in result.relationships if r.relationship_type == RelationshipType.USES]
+        uses_rels = list(result.relationships_of_type(RelationshipType.USES))
         
         for rel in uses_rels:
             # Check if the target is a storeID that maps to a data source
@@ -200,14 +237,7 @@ class CognosParser(BaseParser):
                 ds_obj_id = data_sources_by_store_id[target_id]
                 
                 # Check if CONNECTS_TO relationship already exists
-                existing = any(
-                    r.source_id == rel.source_id and 
-                    r.target_id == ds_obj_id and 
-                    r.relationship_type == RelationshipType.CONNECTS_TO
-                    for r in result.relationships
-                )
-                
-                if not existing:
+                if (rel.source_id, ds_obj_id) not in connected:
                     connects_rel = Relationship(
                         source_id=rel.source_id,
                         target_id=ds_obj_id,
@@ -219,45 +249,35 @@ class CognosParser(BaseParser):
                         }
                     )
                     result.add_relationship(connects_rel)
+                    connected.add((rel.source_id, ds_obj_id))
         
         # Also check for data modules that might reference data sources directly
-        for obj in result.objects:
-            if obj.object_type == ObjectType.DATA_MODULE:
-                store_id = obj.properties.get("storeID")
-                # Check if this module's storeID is referenced by any data source
-                # (This would indicate the module is connected to a data source)
-                for ds_obj in result.objects:
-                    if ds_obj.object_type == ObjectType.DATA_SOURCE:
-                        ds_store_id = ds_obj.properties.get("storeID")
-                        # Check if module references this data source via useSpec
-                        # Look for USES relationships from this module
-                        module_uses = [
-                            r for r in result.relationships 
-                            if r.source_id == obj.object_id and 
-                            r.relationship_type == RelationshipType.USES and
-                            r.properties.get("dependency_type") == "data_source"
-                        ]
-                        for use_rel in module_uses:
-                            if use_rel.target_id in data_sources_by_store_id:
-                                ds_id = data_sources_by_store_id[use_rel.target_id]
-                                # Create CONNECTS_TO if it doesn't exist
-                                existing = any(
-                                    r.source_id == obj.object_id and 
-                                    r.target_id == ds_id and 
-                                    r.relationship_type == RelationshipType.CONNECTS_TO
-                                    for r in result.relationships
-                                )
-                                if not existing:
-                                    connects_rel = Relationship(
-                                        source_id=obj.object_id,
-                                        target_id=ds_id,
-                                        relationship_type=RelationshipType.CONNECTS_TO,
-                                        properties={
-                                            "connection_type": use_rel.properties.get("ref_type", "unknown"),
-                                            "source": "post_process"
-                                        }
-                                    )
-                                    result.add_relationship(connects_rel)
+        # (only meaningful once at least one data source object exists)
+        if result.objects_of_type(ObjectType.DATA_SOURCE):
+            # Data-source USES relationships by source, in relationship order
+            data_source_uses: dict = {}
+            for r in uses_rels:
+                if r.properties.get("dependency_type") == "data_source":
+                    data_source_uses.setdefault(r.source_id, []).append(r)
+            
+            for obj in result.objects_of_type(ObjectType.DATA_MODULE):
+                # Look for USES relationships from this module
+                for use_rel in data_source_uses.get(obj.object_id, ()):
+                    if use_rel.target_id in data_sources_by_store_id:
+                        ds_id = data_sources_by_store_id[use_rel.target_id]
+                        # Create CONNECTS_TO if it doesn't exist
+                        if (obj.object_id, ds_id) not in connected:
+                            connects_rel = Relationship(
+                                source_id=obj.object_id,
+                                target_id=ds_id,
+                                relationship_type=RelationshipType.CONNECTS_TO,
+                                properties={
+                                    "connection_type": use_rel.properties.get("ref_type", "unknown"),
+                                    "source": "post_process"
+                                }
+                            )
+                            result.add_relationship(connects_rel)
+                            connected.add((obj.object_id, ds_id))
     
     def _parse_manifest(self, extract_dir: Path, result: ParseResult) -> None:
         """
@@ -503,15 +523,6 @@ class CognosParser(BaseParser):
         try:
             self._log_progress(f"Parsing {package_path.name}", "debug")
             
-            # Use streaming parser for large files
-            from .extractors import (
-                FolderExtractor,
-                ReportExtractor,
-                DashboardExtractor,
-                DataModuleExtractor,
-                VisualizationExtractor,
-            )
-            
             # For now, parse the entire file
             tree = XmlHandler.parse(package_path)
             root = XmlHandler.get_root(tree)
@@ -525,18 +536,14 @@ class CognosParser(BaseParser):
                 )
                 return
             
-            # Initialize extractors
-            extractors = {
-                ObjectType.FOLDER: FolderExtractor(),
-                ObjectType.REPORT: ReportExtractor(),
-                ObjectType.DASHBOARD: DashboardExtractor(),
-                ObjectType.DATA_MODULE: DataModuleExtractor(),
-                ObjectType.VISUALIZATION: VisualizationExtractor(),
-            }
+            # Extractors are created on first use (see _get_extractor)
+            extractors = {}
             
-            # Process each object element
+            # Process each object element; clear it afterwards so large payloads
+            # (e.g. dashboard specification JSON) are freed as we go, not at the end
             for obj_elem in objects_elem.findall("object"):
                 self._parse_object(obj_elem, package_path.name, result, extractors)
+                obj_elem.clear()
             
         except Exception as e:
             logger.exception(f"Error parsing {package_path.name}: {e}")
@@ -546,6 +553,24 @@ class CognosParser(BaseParser):
                 file_name=package_path.name
             ))
     
+    @staticmethod
+    def _get_extractor(object_type: ObjectType, extractors: dict):
+        """
+        Return the extractor for an object type, creating it on first use.
+        
+        Args:
+            object_type: ObjectType with an entry in _EXTRACTOR_CLASS_NAMES
+            extractors: Per-file cache of extractor instances
+        
+        Returns:
+            Extractor instance
+        """
+        extractor = extractors.get(object_type)
+        if extractor is None:
+            extractor_class = EXTRACTOR_TABLE[_EXTRACTOR_CLASS_NAMES[object_type]]()
+            extractor = extractors[object_type] = extractor_class()
+        return extractor
+    
     def _parse_object(
         self,
         obj_elem,
@@ -560,7 +585,7 @@ class CognosParser(BaseParser):
             obj_elem: XML element representing the object
             source_file: Name of source file
             result: ParseResult to add objects/errors to
-            extractors: Dictionary of initialized extractors
+            extractors: Per-file cache of extractor instances (created on first use)
         """
         try:
             # Get object type (class)
@@ -617,13 +642,13 @@ class CognosParser(BaseParser):
             object_type = object_type_map.get(obj_class, ObjectType.UNKNOWN)
             
             # If we have a specific extractor for this type, use it
-            if extractors and object_type in extractors:
+            if extractors is not None and object_type in _EXTRACTOR_CLASS_NAMES:
                 # Skip data module if already extracted (e.g. from another package file)
                 if object_type == ObjectType.DATA_MODULE:
                     obj_id = XmlHandler.get_text(obj_elem, "id", default="")
                     if obj_id and result.has_object_id(obj_id):
                         return
-                extractor = extractors[object_type]
+                extractor = self._get_extractor(object_type, extractors)
                 objects, relationships, errors = extractor.extract(obj_elem)
                 
                 for obj in objects:
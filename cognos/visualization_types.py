@@ -4,9 +4,13 @@ Visualization type mappings for Cognos.
 This module provides comprehensive mapping of Cognos visualization IDs (visId)
 to human-readable chart type names. Used by DashboardExtractor and ReportExtractor.
 """
+from functools import lru_cache
 from typing import Optional
 import re
 
+# lowercase->uppercase boundary in camelCase ids ("bubbleChart" -> "bubble Chart")
+_CAMEL_CASE_BOUNDARY = re.compile(r'([a-z])([A-Z])')
+
 
 # Dashboard Widget visId to Chart Type mapping
 # These are found in exploration/dashboard JSON specifications
@@ -175,10 +179,17 @@ def map_dashboard_visid_to_type(vis_id: str) -> str:
     if not vis_id:
         return "Unknown"
     
-    # Direct lookup
-    if vis_id in DASHBOARD_VIS_ID_MAP:
-        return DASHBOARD_VIS_ID_MAP[vis_id]
+    # Direct lookup (one hash probe); unmapped visIds go through the cached fallback
+    viz_type = DASHBOARD_VIS_ID_MAP.get(vis_id)
+    if viz_type is not None:
+        return viz_type
     
+    return _clean_dashboard_visid(vis_id)
+
+
+@lru_cache(maxsize=256)
+def _clean_dashboard_visid(vis_id: str) -> str:
+    """Derive a chart type name from a visId missing from DASHBOARD_VIS_ID_MAP (cached per visId)."""
     # Fallback: clean up the visId
     # Remove com.ibm.vis. prefix and rave2bundle prefix
     clean = vis_id
@@ -188,7 +199,7 @@ def map_dashboard_visid_to_type(vis_id: str) -> str:
     clean = clean.replace("rave", "")
     
     # Convert camelCase to Title Case with spaces
-    clean = re.sub(r'([a-z])([A-Z])', r'\1 \2', clean)
+    clean = _CAMEL_CASE_BOUNDARY.sub(r'\1 \2', clean)
     
     if clean:
         return clean.title()
@@ -212,7 +223,7 @@ def map_report_element_to_type(element_tag: str, chart_type_attr: Optional[str]
         if chart_type_attr in CHART_TYPE_ATTR_MAP:
             return CHART_TYPE_ATTR_MAP[chart_type_attr]
         # Fallback: clean up the attribute
-        clean = re.sub(r'([a-z])([A-Z])', r'\1 \2', chart_type_attr)
+        clean = _CAMEL_CASE_BOUNDARY.sub(r'\1 \2', chart_type_attr)
         return clean.title() + " Chart"
     
     # Direct element lookup
@@ -220,7 +231,7 @@ def map_report_element_to_type(element_tag: str, chart_type_attr: Optional[str]
         return REPORT_ELEMENT_MAP[element_tag]
     
     # Fallback
-    clean = re.sub(r'([a-z])([A-Z])', r'\1 \2', element_tag)
+    clean = _CAMEL_CASE_BOUNDARY.sub(r'\1 \2', element_tag)
     return clean.title()
 
 
@@ -13,7 +13,7 @@ from .models import (
 )
 from .registry import ParserRegistry, create_parser
 
-__all__ = [
+__all__ = (
     "BaseParser",
     "BaseExtractor",
     "ExtractedObject",
@@ -25,4 +25,4 @@ __all__ = [
     "ParseErrorLevel",
     "ParserRegistry",
     "create_parser",
-]
+)
@@ -2,8 +2,12 @@
 Abstract base extractor class for parsing specific object types.
 """
 from abc import ABC, abstractmethod
-from typing import List, Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
 import logging
+import os
+import xml.etree.ElementTree as ET
 
 from .models import ExtractedObject, Relationship, ParseError
 
@@ -11,6 +15,14 @@ from .models import ExtractedObject, Relationship, ParseError
 logger = logging.getLogger(__name__)
 
 
+def _extract_serialized(
+    extractor_cls: Type["BaseExtractor"],
+    xml_bytes: bytes
+) -> Tuple[List[ExtractedObject], List[Relationship], List[ParseError]]:
+    """Process-pool worker for BaseExtractor.extract_batch: re-parse one element and extract it."""
+    return extractor_cls().extract(ET.fromstring(xml_bytes))
+
+
 class BaseExtractor(ABC):
     """
     Abstract base class for extracting specific object types from BI exports.
@@ -48,6 +60,38 @@ class BaseExtractor(ABC):
         """
         pass
     
+    @classmethod
+    def extract_batch(
+        cls,
+        sources: Sequence[ET.Element],
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[List[ExtractedObject], List[Relationship], List[ParseError]]]:
+        """
+        Extract several XML elements in parallel worker processes.
+        
+        Sources are independent, and extracting them is CPU-bound, so a
+        process pool scales with core count. Elements do not pickle, so each
+        one is serialized to XML and re-parsed in its worker, where a fresh
+        ``cls()`` extracts it; subclasses must be constructible without
+        arguments.
+        
+        Args:
+            sources: XML elements to extract
+            max_workers: Worker process count (default: os.cpu_count())
+        
+        Returns:
+            One (objects, relationships, errors) tuple per source, in order
+        """
+        max_workers = min(max_workers or os.cpu_count() or 1, len(sources))
+        if max_workers <= 1:
+            # Not worth starting a pool
+            extractor = cls()
+            return [extractor.extract(source) for source in sources]
+        
+        serialized = [ET.tostring(source) for source in sources]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_extract_serialized, repeat(cls), serialized, chunksize=4))
+    
     def _create_object(
         self,
         object_id: str,
@@ -101,6 +145,39 @@ class BaseExtractor(ABC):
             **kwargs
         )
     
+    def _create_relationships(
+        self,
+        source_id: str,
+        targets: Iterable[Tuple[str, Dict[str, Any]]],
+        relationship_type: str
+    ) -> List[Relationship]:
+        """
+        Helper to create relationships of one type from one source in bulk.
+        
+        The relationship type is resolved once for the whole batch rather
+        than once per relationship.
+        
+        Args:
+            source_id: Source object ID
+            targets: (target_id, properties) pairs
+            relationship_type: Type of relationship
+        
+        Returns:
+            Relationship instances, in target order
+        """
+        from .models import RelationshipType
+        
+        rel_type = RelationshipType(relationship_type)
+        return [
+            Relationship(
+                source_id=source_id,
+                target_id=target_id,
+                relationship_type=rel_type,
+                properties=properties
+            )
+            for target_id, properties in targets
+        ]
+    
     def _create_error(
         self,
         level: str,
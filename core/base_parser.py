@@ -3,7 +3,7 @@ Abstract base parser class for BI tool parsers.
 """
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Union
 import logging
 
 from .models import ParseResult
@@ -18,8 +18,21 @@ class BaseParser(ABC):
     
     Each BI tool (Cognos, Tableau, Power BI, etc.) should implement
     this interface to provide consistent parsing functionality.
+    
+    Subclasses declared with a tool name register themselves in
+    ParserRegistry when their module is imported::
+    
+        class TableauParser(BaseParser, tool_name="tableau"):
+            ...
     """
     
+    def __init_subclass__(cls, tool_name: Optional[str] = None, **kwargs):
+        """Register the subclass in ParserRegistry when declared with tool_name."""
+        super().__init_subclass__(**kwargs)
+        if tool_name:
+            from .registry import ParserRegistry
+            ParserRegistry.register(tool_name, cls)
+    
     def __init__(self, config: dict = None):
         """
         Initialize the parser.
@@ -30,6 +43,23 @@ class BaseParser(ABC):
         self.config = config or {}
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
     
+    @classmethod
+    def describe_capabilities(cls) -> Dict[str, Any]:
+        """
+        Describe what this parser supports.
+        
+        Called by ParserRegistry.capabilities() on demand, never at
+        registration, so overrides may do more expensive introspection.
+        
+        Returns:
+            Dict with at least "tool_name" and "supported_versions"
+        """
+        parser = cls()
+        return {
+            "tool_name": parser.tool_name,
+            "supported_versions": list(parser.supported_versions),
+        }
+    
     @property
     @abstractmethod
     def tool_name(self) -> str:
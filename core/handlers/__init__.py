@@ -4,8 +4,8 @@ from .zip_handler import ZipHandler
 from .xml_handler import XmlHandler
 from .json_handler import JsonHandler
 
-__all__ = [
+__all__ = (
     "ZipHandler",
     "XmlHandler",
     "JsonHandler",
-]
+)
@@ -3,7 +3,7 @@ XML file handler for parsing BI exports.
 """
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Union, Optional, Iterator, Dict, Any
+from typing import Union, Optional, Iterator, Dict, Any, Iterable, List
 import logging
 
 
@@ -116,6 +116,41 @@ class XmlHandler:
             return root.find(xpath, namespaces)
         return root.find(xpath)
     
+    @staticmethod
+    def find_many(
+        element: ET.Element,
+        xpaths: Iterable[str]
+    ) -> Dict[str, Optional[ET.Element]]:
+        """
+        Find the first match of several simple child paths in one pass.
+        
+        The element's children are indexed by tag once, so each path only
+        searches below its matching children instead of rescanning all of
+        them. Paths must be plain tag steps ("a/b/c"), without namespaces
+        or predicates; results match element.find(xpath).
+        
+        Args:
+            element: Element to search from
+            xpaths: Child paths to look up
+        
+        Returns:
+            Dictionary of xpath to first matching element (or None)
+        """
+        children_by_tag: Dict[str, List[ET.Element]] = {}
+        for child in element:
+            children_by_tag.setdefault(child.tag, []).append(child)
+        
+        found = {}
+        for xpath in xpaths:
+            head, _, rest = xpath.partition("/")
+            match = None
+            for child in children_by_tag.get(head, ()):
+                match = child.find(rest) if rest else child
+                if match is not None:
+                    break
+            found[xpath] = match
+        return found
+    
     @staticmethod
     def get_text(
         element: ET.Element,
@@ -3,6 +3,7 @@ Core data models for BI Parser Library.
 
 These models represent the common output format across all BI tool parsers.
 """
+from collections import Counter
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set
@@ -60,6 +61,14 @@ class ParseErrorLevel(str, Enum):
     CRITICAL = "critical"
 
 
+def _count_values(values) -> Dict[str, int]:
+    """Count enum members / strings by their string value, in first-seen order."""
+    return {
+        key.value if isinstance(key, Enum) else str(key): count
+        for key, count in Counter(values).items()
+    }
+
+
 class ExtractedObject(BaseModel):
     """Represents a BI object extracted from source."""
     
@@ -133,6 +142,21 @@ class ParseResult(BaseModel):
     # Deduplication: skip adding object if object_id already seen (same export, package + dataSource or multi-package)
     _seen_object_ids: Set[str] = PrivateAttr(default_factory=set)
     
+    # Objects/relationships grouped by type (kept in sync by add_object/add_relationship)
+    # so type filters are a dict lookup instead of a scan over every entry
+    _objects_by_type: Dict[str, List[ExtractedObject]] = PrivateAttr(default_factory=dict)
+    _relationships_by_type: Dict[str, List[Relationship]] = PrivateAttr(default_factory=dict)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build the ID set and type indexes from objects/relationships given at construction."""
+        # Results built via the constructor, model_validate or model_validate_json
+        # arrive with their lists filled; index them so the lookups below match
+        for obj in self.objects:
+            self._seen_object_ids.add(obj.object_id)
+            self._objects_by_type.setdefault(obj.object_type, []).append(obj)
+        for rel in self.relationships:
+            self._relationships_by_type.setdefault(rel.relationship_type, []).append(rel)
+    
     def has_object_id(self, obj_id: str) -> bool:
         """Return True if an object with this object_id was already added."""
         return obj_id in self._seen_object_ids
@@ -143,10 +167,30 @@ class ParseResult(BaseModel):
             return
         self._seen_object_ids.add(obj.object_id)
         self.objects.append(obj)
+        self._objects_by_type.setdefault(obj.object_type, []).append(obj)
     
     def add_relationship(self, rel: Relationship) -> None:
         """Add a relationship."""
         self.relationships.append(rel)
+        self._relationships_by_type.setdefault(rel.relationship_type, []).append(rel)
+    
+    def objects_of_type(self, object_type: ObjectType) -> List[ExtractedObject]:
+        """
+        Return the added objects of one type, in the order they were added.
+        
+        The returned list is shared with the result; copy it before adding
+        objects of the same type while iterating.
+        """
+        return self._objects_by_type.get(object_type, [])
+    
+    def relationships_of_type(self, relationship_type: RelationshipType) -> List[Relationship]:
+        """
+        Return the added relationships of one type, in the order they were added.
+        
+        The returned list is shared with the result; copy it before adding
+        relationships of the same type while iterating.
+        """
+        return self._relationships_by_type.get(relationship_type, [])
     
     def add_error(self, error: ParseError) -> None:
         """Add a parse error."""
@@ -154,24 +198,11 @@ class ParseResult(BaseModel):
     
     def calculate_stats(self) -> None:
         """Calculate statistics from parsed data."""
-        # Count by object type (convert enum to string value)
-        type_counts = {}
-        for obj in self.objects:
-            # Convert enum to string value for consistent dictionary keys
-            obj_type = obj.object_type.value if isinstance(obj.object_type, Enum) else str(obj.object_type)
-            type_counts[obj_type] = type_counts.get(obj_type, 0) + 1
-        
-        # Count by relationship type
-        rel_type_counts = {}
-        for rel in self.relationships:
-            rel_type = rel.relationship_type.value if isinstance(rel.relationship_type, Enum) else str(rel.relationship_type)
-            rel_type_counts[rel_type] = rel_type_counts.get(rel_type, 0) + 1
-        
-        # Count by error level (convert enum to string value)
-        error_counts = {}
-        for error in self.errors:
-            error_level = error.level.value if isinstance(error.level, Enum) else str(error.level)
-            error_counts[error_level] = error_counts.get(error_level, 0) + 1
+        # Enum members hash and compare like their string values, so members and
+        # plain strings are counted together; keys are then normalized to strings
+        type_counts = _count_values(obj.object_type for obj in self.objects)
+        rel_type_counts = _count_values(rel.relationship_type for rel in self.relationships)
+        error_counts = _count_values(error.level for error in self.errors)
         
         self.stats = {
             "total_objects": len(self.objects),
@@ -1,7 +1,10 @@
 """
 Parser registry for managing BI tool parsers.
 """
-from typing import Dict, Type, Optional
+from functools import lru_cache
+import importlib
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Type, Optional, Tuple, Union
 import logging
 
 from .base_parser import BaseParser
@@ -9,6 +12,12 @@ from .base_parser import BaseParser
 
 logger = logging.getLogger(__name__)
 
+# Parsers shipped with the library: tool name -> (module relative to this package, class name).
+# They are registered on the first lookup that misses the table (see _register_builtin).
+_BUILTIN_PARSERS: Dict[str, Tuple[str, str]] = {
+    "cognos": ("..cognos", "CognosParser"),
+}
+
 
 class ParserRegistry:
     """
@@ -18,7 +27,10 @@ class ParserRegistry:
     can be registered and retrieved dynamically.
     """
     
-    _parsers: Dict[str, Type[BaseParser]] = {}
+    # tool name -> parser class, or a zero-arg loader returning it (see register_lazy)
+    _TABLE: Dict[str, Union[Type[BaseParser], Callable[[], Type[BaseParser]]]] = {}
+    # tool name -> describe_capabilities() result, filled by capabilities()
+    _CAPABILITIES: Dict[str, Mapping[str, Any]] = {}
     
     @classmethod
     def register(cls, tool_name: str, parser_class: Type[BaseParser]) -> None:
@@ -37,9 +49,45 @@ class ParserRegistry:
                 f"Parser class must extend BaseParser, got {parser_class}"
             )
         
-        cls._parsers[tool_name.lower()] = parser_class
+        cls._TABLE[tool_name.lower()] = parser_class
+        cls._CAPABILITIES.pop(tool_name.lower(), None)
+        _cached_parser.cache_clear()
         logger.info(f"Registered parser for '{tool_name}'")
     
+    @classmethod
+    def register_lazy(
+        cls,
+        tool_name: str,
+        loader: Callable[[], Type[BaseParser]]
+    ) -> None:
+        """
+        Register a loader that imports a parser class on first use.
+        
+        Lets a package advertise a parser without importing its module
+        (and extractors) until a parser for that tool is requested.
+        An already registered parser class is never replaced by a loader.
+        
+        Args:
+            tool_name: Name of the BI tool (e.g., "cognos", "tableau")
+            loader: Zero-argument callable returning the parser class
+        """
+        cls._TABLE.setdefault(tool_name.lower(), loader)
+    
+    @classmethod
+    def _resolve(cls, tool_name: str) -> Optional[Type[BaseParser]]:
+        """Return the parser class for tool_name, running its loader once if needed."""
+        key = tool_name.lower()
+        entry = cls._TABLE.get(key)
+        if entry is None:
+            return _register_builtin(key)
+        if isinstance(entry, type):
+            return entry
+        parser_class = entry()
+        # Parsers declared with tool_name= already registered themselves on import
+        if cls._TABLE.get(key) is not parser_class:
+            cls.register(key, parser_class)
+        return parser_class
+    
     @classmethod
     def get_parser(cls, tool_name: str, config: dict = None) -> BaseParser:
         """
@@ -55,10 +103,10 @@ class ParserRegistry:
         Raises:
             ValueError: If no parser registered for tool_name
         """
-        parser_class = cls._parsers.get(tool_name.lower())
+        parser_class = cls._resolve(tool_name)
         
         if not parser_class:
-            available = ", ".join(cls._parsers.keys())
+            available = ", ".join(cls.list_parsers())
             raise ValueError(
                 f"No parser registered for '{tool_name}'. "
                 f"Available parsers: {available}"
@@ -66,15 +114,47 @@ class ParserRegistry:
         
         return parser_class(config=config)
     
+    @classmethod
+    def capabilities(cls, tool_name: str) -> Mapping[str, Any]:
+        """
+        Get what a registered parser supports (tool name, versions, ...).
+        
+        The parser class (and, for lazy registrations, its module) is only
+        loaded here, and the result is cached per tool.
+        
+        Args:
+            tool_name: Name of the BI tool
+        
+        Returns:
+            Read-only mapping from the parser's describe_capabilities()
+        
+        Raises:
+            ValueError: If no parser registered for tool_name
+        """
+        key = tool_name.lower()
+        caps = cls._CAPABILITIES.get(key)
+        if caps is None:
+            parser_class = cls._resolve(key)
+            if not parser_class:
+                available = ", ".join(cls.list_parsers())
+                raise ValueError(
+                    f"No parser registered for '{tool_name}'. "
+                    f"Available parsers: {available}"
+                )
+            caps = cls._CAPABILITIES[key] = MappingProxyType(
+                parser_class.describe_capabilities()
+            )
+        return caps
+    
     @classmethod
     def list_parsers(cls) -> list[str]:
         """
         List all registered BI tool parsers.
         
         Returns:
-            List of registered tool names
+            List of registered tool names (built-in parsers included)
         """
-        return list(cls._parsers.keys())
+        return list(dict.fromkeys([*cls._TABLE, *_BUILTIN_PARSERS]))
     
     @classmethod
     def is_supported(cls, tool_name: str) -> bool:
@@ -87,16 +167,43 @@ class ParserRegistry:
         Returns:
             True if supported, False otherwise
         """
-        return tool_name.lower() in cls._parsers
+        key = tool_name.lower()
+        return key in cls._TABLE or key in _BUILTIN_PARSERS
+
+
+def _register_builtin(tool_name: str) -> Optional[Type[BaseParser]]:
+    """Import and register a built-in parser; None if tool_name isn't built in."""
+    spec = _BUILTIN_PARSERS.get(tool_name)
+    if spec is None:
+        return None
+    module_name, class_name = spec
+    parser_class = getattr(importlib.import_module(module_name, __package__), class_name)
+    # Built-in parsers declare tool_name= and so registered themselves on import
+    if ParserRegistry._TABLE.get(tool_name) is not parser_class:
+        ParserRegistry.register(tool_name, parser_class)
+    return parser_class
 
 
-def create_parser(tool_name: str, config: dict = None) -> BaseParser:
+@lru_cache(maxsize=16)
+def _cached_parser(tool_name: str, config_key: Tuple[Tuple[str, Any], ...]) -> BaseParser:
+    """Build (once per tool and config) the parser instance shared by create_parser."""
+    return ParserRegistry.get_parser(tool_name, dict(config_key))
+
+
+def create_parser(tool_name: str, config: dict = None, fresh: bool = False) -> BaseParser:
     """
     Factory function to create a parser instance.
     
+    Parsers are reused: calls with the same tool name and config return
+    the same instance, so batch jobs don't rebuild the parser per file.
+    Parsers keep per-parse state local to parse(), so a shared instance
+    can be handed to several callers. Pass fresh=True when the caller
+    needs its own instance.
+    
     Args:
         tool_name: Name of the BI tool (e.g., "cognos", "tableau")
         config: Optional configuration for the parser
+        fresh: Always construct a new parser instead of reusing one
     
     Returns:
         Parser instance
@@ -104,4 +211,14 @@ def create_parser(tool_name: str, config: dict = None) -> BaseParser:
     Raises:
         ValueError: If no parser registered for tool_name
     """
+    if not fresh:
+        try:
+            config_key = tuple(sorted((config or {}).items()))
+            hash(config_key)
+        except TypeError:
+            # Unhashable (or unsortable) config values can't key the cache
+            pass
+        else:
+            # Outside the try: errors raised while building the parser must propagate
+            return _cached_parser(tool_name.lower(), config_key)
     return ParserRegistry.get_parser(tool_name, config)
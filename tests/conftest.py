@@ -0,0 +1,22 @@
+"""
+Pytest setup: make the repository root importable as the bi_parsers package.
+
+The repository root is the package itself (relative imports throughout), so
+it is loaded under its distribution name when not already installed.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if "bi_parsers" not in sys.modules:
+    try:
+        import bi_parsers  # noqa: F401  (installed package)
+    except ImportError:
+        spec = importlib.util.spec_from_file_location(
+            "bi_parsers", ROOT / "__init__.py", submodule_search_locations=[str(ROOT)]
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["bi_parsers"] = module
+        spec.loader.exec_module(module)
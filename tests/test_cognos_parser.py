@@ -0,0 +1,35 @@
+"""Tests for CognosParser configuration handling."""
+import pytest
+
+from bi_parsers.cognos.config import CognosFilters
+from bi_parsers.cognos.parser import CognosParser
+
+
+def test_config_overrides_are_applied():
+    parser = CognosParser(config={"include_folders": "no", "max_file_size_mb": 10.0})
+    assert not parser.cognos_config.flags & CognosFilters.FOLDERS
+    assert parser.cognos_config.max_file_size_bytes == 10 << 20
+
+
+def test_unhashable_override_reports_the_field():
+    with pytest.raises(TypeError, match="include_folders"):
+        CognosParser(config={"include_folders": [1]})
+
+
+def test_include_folders_false_keeps_parent_references_resolvable(tmp_path):
+    (tmp_path / "content.xml").write_text("<content/>")
+    (tmp_path / "package1.xml").write_text(
+        "<pkg><objects>"
+        "<object><class>folder</class><id>F1</id><name>Root</name></object>"
+        "<object><class>query</class><id>Q1</id><name>Q</name><parentId>F1</parentId></object>"
+        "</objects></pkg>"
+    )
+    parser = CognosParser(config={"include_folders": False, "cleanup_temp": False})
+    result = parser.parse(tmp_path)
+
+    object_ids = {obj.object_id for obj in result.objects}
+    assert {"F1", "Q1"} <= object_ids
+    for obj in result.objects:
+        assert not obj.parent_id or obj.parent_id in object_ids
+    for rel in result.relationships:
+        assert rel.source_id in object_ids and rel.target_id in object_ids
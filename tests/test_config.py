@@ -0,0 +1,40 @@
+"""Tests for CognosConfig option validation."""
+import pytest
+
+from bi_parsers.cognos.config import CognosConfig, CognosFilters
+
+
+@pytest.mark.parametrize("value, expected", [
+    (True, True), (False, False), ("true", True), ("false", False),
+    ("yes", True), ("no", False), ("Off", False), (" 1 ", True), (0, False), (1, True),
+])
+def test_bool_options_are_coerced(value, expected):
+    config = CognosConfig(include_folders=value)
+    assert config.include_folders is expected
+    assert bool(config.flags & CognosFilters.FOLDERS) is expected
+
+
+@pytest.mark.parametrize("value, error", [("maybe", ValueError), (2, ValueError), ([1], TypeError), (None, TypeError)])
+def test_invalid_bool_option_names_the_field(value, error):
+    with pytest.raises(error, match="include_folders"):
+        CognosConfig(include_folders=value)
+
+
+@pytest.mark.parametrize("value", [10, 10.0, "10", " 10 "])
+def test_size_options_are_coerced_to_int(value):
+    config = CognosConfig(max_file_size_mb=value, streaming_threshold_mb=value)
+    assert config.max_file_size_mb == 10 and type(config.max_file_size_mb) is int
+    assert config.max_file_size_bytes == 10 << 20
+    assert config.streaming_threshold_bytes == 10 << 20
+
+
+@pytest.mark.parametrize("field", ["max_file_size_mb", "streaming_threshold_mb", "max_relationship_depth"])
+@pytest.mark.parametrize("value, error", [(10.5, ValueError), ("ten", ValueError), (True, TypeError), ([10], TypeError)])
+def test_invalid_int_option_names_the_field(field, value, error):
+    with pytest.raises(error, match=field):
+        CognosConfig(**{field: value})
+
+
+def test_non_positive_size_is_rejected():
+    with pytest.raises(ValueError, match="must be positive"):
+        CognosConfig(max_file_size_mb="0")
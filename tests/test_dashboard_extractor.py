@@ -0,0 +1,63 @@
+"""Tests for DashboardExtractor."""
+import json
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+from bi_parsers.cognos.extractors.dashboard_extractor import DashboardExtractor
+
+
+def _dashboard_element(spec):
+    return ET.fromstring(
+        "<object><id>D</id><name>Dash</name><parentId>P</parentId><class>exploration</class>"
+        f"<props><specification><value>{escape(json.dumps(spec))}</value></specification></props></object>"
+    )
+
+
+def test_malformed_tab_entry_only_drops_that_tab():
+    spec = {
+        "layout": {"tabs": [5, {"id": "ok", "name": "Ok", "items": [{"type": "widget", "id": "w"}]}]},
+        "widgets": {"w": {"type": "live", "visId": "com.ibm.vis.rave2bundlebar", "sortBy": [{"column": "c"}]}},
+        "pageContext": [{"origin": "filter", "hierarchyNames": ["Region"]}],
+    }
+    objects, relationships, errors = DashboardExtractor().extract(_dashboard_element(spec))
+    
+    by_id = {obj.object_id: obj for obj in objects}
+    assert by_id["D"].object_type == "dashboard"
+    assert "D:tab:ok" in by_id
+    assert by_id["D:widget:w"].parent_id == "D:tab:ok"
+    assert any(obj.object_type == "filter" for obj in objects)
+    assert any(obj.object_type == "sort" for obj in objects)
+    assert ("D:tab:ok", "D:widget:w") in {(rel.source_id, rel.target_id) for rel in relationships}
+    
+    assert len(errors) == 1
+    assert errors[0].level == "warning"
+    assert errors[0].message.startswith("Failed to extract tab 0")
+
+
+def _dump(batch):
+    return [
+        (
+            [obj.model_dump() for obj in objects],
+            [rel.model_dump() for rel in relationships],
+            [err.model_dump(exclude={"timestamp"}) for err in errors],
+        )
+        for objects, relationships, errors in batch
+    ]
+
+
+def test_pooled_batch_matches_serial_batch():
+    sources = []
+    for i in range(3):
+        spec = {
+            "layout": {"tabs": [5, {"id": f"t{i}", "name": "Tab", "items": [{"type": "widget", "id": "w"}]}]},
+            "widgets": {"w": {"type": "live", "visId": "com.ibm.vis.rave2bundlebar"}},
+        }
+        element = _dashboard_element(spec)
+        element.find("id").text = f"D{i}"
+        sources.append(element)
+    
+    serial = DashboardExtractor.extract_batch(sources, max_workers=1)
+    pooled = DashboardExtractor.extract_batch(sources, max_workers=2)
+    
+    assert len(pooled) == len(sources)
+    assert _dump(pooled) == _dump(serial)
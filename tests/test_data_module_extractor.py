@@ -0,0 +1,40 @@
+"""Tests for DataModuleExtractor."""
+import json
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+from bi_parsers.cognos.extractors.data_module_extractor import DataModuleExtractor
+
+
+def _data_module_element(module_id, smarts):
+    return ET.fromstring(
+        f"<object><class>module</class><id>{module_id}</id><name>Mod</name><parentId>F</parentId>"
+        f"<props><smartsData>{escape(json.dumps(smarts))}</smartsData>"
+        "<tags><value><item>Orders.Region</item></value></tags></props></object>"
+    )
+
+
+def _dump(batch):
+    return [
+        (
+            [obj.model_dump() for obj in objects],
+            [rel.model_dump() for rel in relationships],
+            [err.model_dump(exclude={"timestamp"}) for err in errors],
+        )
+        for objects, relationships, errors in batch
+    ]
+
+
+def test_pooled_batch_matches_serial_batch():
+    smarts = {"moserJSON": {"querySubject": [{"name": "Orders", "id": "qs1", "queryItem": [
+        {"name": "Region", "expression": "[c].[Orders].[Region]", "usage": "attribute"},
+        {"name": "Qty", "expression": "[c].[Orders].[Qty]", "usage": 2, "regularAggregate": "total"},
+    ]}]}}
+    sources = [_data_module_element(f"M{i}", smarts) for i in range(3)]
+    
+    serial = DataModuleExtractor.extract_batch(sources, max_workers=1)
+    pooled = DataModuleExtractor.extract_batch(sources, max_workers=2)
+    
+    assert len(pooled) == len(sources)
+    assert all(objects for objects, _, _ in serial)
+    assert _dump(pooled) == _dump(serial)
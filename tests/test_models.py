@@ -0,0 +1,44 @@
+"""Tests for the core result models."""
+import weakref
+
+from bi_parsers.core.models import ExtractedObject, ParseError, ParseErrorLevel, Relationship, RelationshipType
+
+
+def test_models_support_weak_references():
+    obj = ExtractedObject(object_id="1", object_type="report", name="r", bi_tool="cognos")
+    rel = Relationship(source_id="1", target_id="2", relationship_type=RelationshipType.USES)
+    err = ParseError(level=ParseErrorLevel.WARNING, message="m")
+    for model in (obj, rel, err):
+        assert weakref.ref(model)() is model
+
+
+def _sample_result():
+    from bi_parsers.core.models import ObjectType, ParseResult
+    result = ParseResult()
+    result.add_object(ExtractedObject(object_id="r1", object_type=ObjectType.REPORT, name="r", bi_tool="cognos"))
+    result.add_object(ExtractedObject(object_id="f1", object_type=ObjectType.FOLDER, name="f", bi_tool="cognos"))
+    result.add_relationship(Relationship(source_id="f1", target_id="r1", relationship_type=RelationshipType.PARENT_CHILD))
+    return result
+
+
+def test_type_index_survives_model_dump_round_trip():
+    from bi_parsers.core.models import ObjectType, ParseResult
+    result = _sample_result()
+    for restored in (
+        ParseResult.model_validate(result.model_dump()),
+        ParseResult.model_validate_json(result.model_dump_json()),
+        ParseResult(objects=result.objects, relationships=result.relationships),
+    ):
+        assert [obj.object_id for obj in restored.objects_of_type(ObjectType.REPORT)] == ["r1"]
+        assert [obj.object_id for obj in restored.objects_of_type(ObjectType.FOLDER)] == ["f1"]
+        assert len(restored.relationships_of_type(RelationshipType.PARENT_CHILD)) == 1
+        assert restored.has_object_id("r1")
+
+
+def test_add_object_after_validation_keeps_first_wins():
+    from bi_parsers.core.models import ObjectType, ParseResult
+    restored = ParseResult.model_validate(_sample_result().model_dump())
+    restored.add_object(ExtractedObject(object_id="r1", object_type=ObjectType.REPORT, name="dup", bi_tool="cognos"))
+    restored.add_object(ExtractedObject(object_id="r2", object_type=ObjectType.REPORT, name="r2", bi_tool="cognos"))
+    assert [obj.object_id for obj in restored.objects_of_type(ObjectType.REPORT)] == ["r1", "r2"]
+    assert len(restored.objects) == 3
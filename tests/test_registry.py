@@ -0,0 +1,81 @@
+"""Tests for ParserRegistry and create_parser."""
+from pathlib import Path
+from typing import List, Union
+
+import pytest
+
+from bi_parsers.core.base_parser import BaseParser
+from bi_parsers.core.models import ParseResult
+from bi_parsers.core.registry import ParserRegistry, create_parser
+
+
+class _DummyParser(BaseParser):
+    instances = 0
+    attempts = 0
+    
+    def __init__(self, config: dict = None):
+        type(self).attempts += 1
+        if (config or {}).get("bad"):
+            raise TypeError("bad must not be set")
+        super().__init__(config)
+        type(self).instances += 1
+    
+    @property
+    def tool_name(self) -> str:
+        return "dummy"
+    
+    @property
+    def supported_versions(self) -> List[str]:
+        return ["1"]
+    
+    def parse(self, file_path: Union[str, Path]) -> ParseResult:
+        return ParseResult()
+    
+    def validate_export(self, file_path: Union[str, Path]) -> bool:
+        return True
+
+
+@pytest.fixture
+def dummy_tool():
+    ParserRegistry.register("dummy-test", _DummyParser)
+    _DummyParser.instances = 0
+    _DummyParser.attempts = 0
+    yield "dummy-test"
+    ParserRegistry._TABLE.pop("dummy-test", None)
+
+
+def test_create_parser_reuses_instances(dummy_tool):
+    first = create_parser(dummy_tool, {"a": 1})
+    assert create_parser(dummy_tool.upper(), {"a": 1}) is first
+    assert create_parser(dummy_tool, {"a": 2}) is not first
+    assert _DummyParser.instances == 2
+
+
+def test_create_parser_fresh_builds_new_instance(dummy_tool):
+    shared = create_parser(dummy_tool)
+    fresh = create_parser(dummy_tool, fresh=True)
+    assert fresh is not shared
+    assert isinstance(fresh, _DummyParser)
+
+
+def test_register_clears_cached_parsers(dummy_tool):
+    before = create_parser(dummy_tool)
+    ParserRegistry.register(dummy_tool, _DummyParser)
+    assert create_parser(dummy_tool) is not before
+
+
+def test_unhashable_config_bypasses_cache(dummy_tool):
+    first = create_parser(dummy_tool, {"items": [1]})
+    assert create_parser(dummy_tool, {"items": [1]}) is not first
+
+
+def test_constructor_type_error_is_not_retried(dummy_tool):
+    with pytest.raises(TypeError, match="bad must not be set"):
+        create_parser(dummy_tool, {"bad": True})
+    assert _DummyParser.attempts == 1
+
+
+def test_shared_cognos_parser_keeps_no_per_parse_state(tmp_path):
+    parser = create_parser("cognos")
+    parser.parse(tmp_path / "missing.zip")
+    assert not hasattr(parser, "temp_dir")